@@ -0,0 +1,26 @@
+"""
+Agent package bootstrap.
+
+Logging and .env loading happen once here instead of per-module: every
+agent import used to call logging.basicConfig and load_dotenv again,
+re-touching the root logger and re-reading the same file.
+"""
+import logging
+
+import nest_asyncio
+from dotenv import load_dotenv
+
+# The agents hold loop-bound asyncio primitives across calls (the shared
+# rate-limit bucket's Lock, the shared aiohttp transport), but their sync
+# wrappers each call asyncio.run(). Under stock asyncio every run() spins
+# up a fresh loop, so the second call dies with "bound to a different
+# event loop". nest_asyncio patches run() to reuse one persistent loop —
+# previously that only held when editor.py (which applies it for
+# Playwright) happened to be imported first; the package must not depend
+# on an unrelated module's import side effect.
+nest_asyncio.apply()
+
+if not logging.getLogger().handlers:
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+load_dotenv()
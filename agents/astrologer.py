@@ -1,10 +1,19 @@
 import os
+import re
 import json
+import time
+import heapq
+import asyncio
 import logging
-import requests
 from datetime import datetime
-from openai import OpenAI
-from dotenv import load_dotenv
+from functools import cached_property
+from openai import AsyncOpenAI
+
+# Logging and .env loading are handled once in agents/__init__.py
+from agents import fastjson, llm_cache
+from agents.http import get_shared_http_client
+from agents.model_discovery import fetch_openrouter_models
+from agents.rate_limit import openrouter_limiter
 
 # Try to import Google AI
 try:
@@ -13,17 +22,169 @@ try:
 except ImportError:
     GOOGLE_AI_AVAILABLE = False
 
-# Load environment variables
-load_dotenv()
+# All 12 Rashis in traditional order (matches RASHI_ORDER in main.py)
+RASHIS = [
+    "Mesh (Aries)", "Vrushabh (Taurus)", "Mithun (Gemini)", "Kark (Cancer)",
+    "Singh (Leo)", "Kanya (Virgo)", "Tula (Libra)", "Vrushchik (Scorpio)",
+    "Dhanu (Sagittarius)", "Makar (Capricorn)", "Kumbh (Aquarius)", "Meen (Pisces)"
+]
+
+# Model Ranking Heuristics (precompiled — one regex scan per model id)
+# 1. Prefer 'gemini' (best for creative writing)
+# 2. Prefer 'llama-3' (strong instruction following)
+# 3. Prefer 'deepseek' (good reasoning)
+# 4. Prefer larger models ('70b', 'flash')
+# 5. Avoid tiny models ('nano', '1b', '3b')
+MODEL_SCORE_MAP = {
+    "gemini": 10, "llama-3": 8, "deepseek": 7, "phi-4": 6,
+    "flash": 3, "exp": 2, "70b": 2,
+    "nano": -20, "1b": -20, "3b": -20,
+}
+MODEL_SCORE_RE = re.compile("|".join(MODEL_SCORE_MAP))
+
+# Default bench window after a 429 when the server sends no Retry-After
+PARK_SECONDS = 60.0
+
+
+def _park_duration(error) -> float:
+    """Bench window for a 429: the server's Retry-After when given, else 60s."""
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if headers:
+        retry_after = headers.get("Retry-After") or headers.get("retry-after")
+        try:
+            if retry_after is not None:
+                return min(max(float(retry_after), 1.0), 300.0)
+        except (TypeError, ValueError):
+            pass
+    return PARK_SECONDS
+
+# --- Prompt templates ------------------------------------------------------
+# Built once at import; per-call work is a single %-substitution instead of
+# rebuilding several hundred bytes of identical literal text 36x per day.
+
+DAILY_SYSTEM_PROMPT = """
+You are 'Rishiraj', an expert Vedic Astrologer. Tone: Mystical, Positive, Authoritative.
+Write a DAILY Horoscope Script in PURE HINDI.
+Do NOT mention specific dates.
+"""
+
+DAILY_USER_TMPL = """
+Generate a **Daily Horoscope** for **%s** for %s.
+Return ONLY valid JSON:
+{
+    "hook": "Short attention grabber (Hindi)",
+    "intro": "Astrological context (Gochar)",
+    "love": "Love prediction",
+    "career": "Career prediction",
+    "money": "Financial prediction",
+    "health": "Health prediction",
+    "remedy": "Specific Vedic remedy",
+    "lucky_color": "Color",
+    "lucky_number": "Number"
+}
+"""
+
+ALL_DAILY_SYSTEM_PROMPT = """
+You are 'Rishiraj', an expert Vedic Astrologer. Tone: Mystical, Positive, Authoritative.
+Write DAILY Horoscope Scripts in PURE HINDI.
+Do NOT mention specific dates.
+"""
+
+ALL_DAILY_USER_TMPL = """
+Generate a **Daily Horoscope** for EACH of these rashis: %s for %s.
+Return ONLY valid JSON: one object keyed by rashi name (e.g. "Mesh (Aries)"),
+where every value has this structure:
+{
+    "hook": "Short attention grabber (Hindi)",
+    "intro": "Astrological context (Gochar)",
+    "love": "Love prediction",
+    "career": "Career prediction",
+    "money": "Financial prediction",
+    "health": "Health prediction",
+    "remedy": "Specific Vedic remedy",
+    "lucky_color": "Color",
+    "lucky_number": "Number"
+}
+"""
 
-# Setup Logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+MONTHLY_SYSTEM_PROMPT = """
+You are 'Rishiraj', an expert Vedic Astrologer. Tone: Detailed, Predictive, Guiding.
+Write a MONTHLY Horoscope Script in PURE HINDI.
+Focus on major planetary shifts (Sun transit, Moon phases).
+"""
+
+MONTHLY_USER_TMPL = """
+Generate a **Monthly Horoscope** for **%s** for **%s**.
+Return ONLY valid JSON:
+{
+    "hook": "Major theme of the month (Hindi)",
+    "intro": "Overview of the month & planetary changes",
+    "love": "Detailed Relationship forecast",
+    "career": "Detailed Career & Business forecast",
+    "money": "Financial opportunities & risks",
+    "health": "Health warnings",
+    "remedy": "Major monthly remedy (Upay)",
+    "lucky_dates": "List of lucky dates"
+}
+"""
+
+YEARLY_SYSTEM_PROMPT = """
+You are 'Rishiraj', the Grand Vedic Astrologer. Tone: Epic, Visionary, Comprehensive.
+Write a YEARLY 'Varshiphal' Script in PURE HINDI.
+Focus on Jupiter (Guru), Saturn (Shani), and Rahu/Ketu transits.
+"""
+
+YEARLY_USER_TMPL = """
+Generate a **Yearly Horoscope** for **%s** for the year **%s**.
+Return ONLY valid JSON:
+{
+    "hook": "The biggest theme of the year (Hindi)",
+    "intro": "Grand overview of the year for this sign",
+    "love": "Love life analysis for the whole year",
+    "career": "Career growth analysis",
+    "money": "Wealth accumulation forecast",
+    "health": "Major health periods to watch",
+    "remedy": "Maha-Upay (Grand Remedy) for the year",
+    "lucky_months": "Best months of the year"
+}
+"""
+
+
+def _strict_schema(name: str, fields: list) -> dict:
+    """Builds a strict json_schema response_format payload for string fields."""
+    return {
+        "name": name,
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {field: {"type": "string"} for field in fields},
+            "required": list(fields),
+            "additionalProperties": False,
+        },
+    }
+
+
+# Strict schemas let supporting providers guarantee the shape server-side
+DAILY_SCHEMA = _strict_schema("daily_horoscope", [
+    "hook", "intro", "love", "career", "money", "health", "remedy",
+    "lucky_color", "lucky_number"])
+MONTHLY_SCHEMA = _strict_schema("monthly_horoscope", [
+    "hook", "intro", "love", "career", "money", "health", "remedy",
+    "lucky_dates"])
+YEARLY_SCHEMA = _strict_schema("yearly_horoscope", [
+    "hook", "intro", "love", "career", "money", "health", "remedy",
+    "lucky_months"])
+
+
+def _score_model_id(model_id: str) -> int:
+    """Scores a model id in a single regex pass (set() keeps each keyword counted once)."""
+    return sum(MODEL_SCORE_MAP[t] for t in set(MODEL_SCORE_RE.findall(model_id.lower())))
 
 class AstrologerAgent:
     """
     The Astrologer Agent uses LLMs to generate authentic Vedic Astrology content.
     It acts like a knowledgeable Shastri (Astrologer).
-    Supports multiple API keys with automatic failover on rate limits.
+    Round-robins across multiple API keys, parking rate-limited ones.
     Falls back to Google AI Studio (Gemini) when OpenRouter is exhausted.
     """
     
@@ -54,30 +215,64 @@ class AstrologerAgent:
             raise ValueError("No API keys found! Need OPENROUTER_API_KEY or GOOGLE_AI_API_KEY")
         
         logging.info(f"🔑 Loaded {len(self.api_keys)} OpenRouter key(s)")
-        
-        self.current_key_index = 0
+
         if self.api_keys:
-            self._init_client()
-            self.models = self.get_best_free_models()
+            self._init_clients()
         else:
-            self.client = None
-            self.models = []
-
-    def _init_client(self):
-        """Initialize OpenAI client with current key."""
-        self.client = OpenAI(
-            base_url="https://openrouter.ai/api/v1",
-            api_key=self.api_keys[self.current_key_index],
-        )
+            self.clients = []
+
+    def _init_clients(self):
+        """
+        Build one async OpenAI client per API key.
+        Requests round-robin over all keys (instead of hammering the primary
+        while a backup idles), which scales RPM headroom with key count.
+        Clients are created once so their connection pools stay warm.
+        All of them ride the process-wide shared aiohttp transport.
+        """
+        client_kwargs = {}
+        shared_http = get_shared_http_client()
+        if shared_http is not None:
+            client_kwargs["http_client"] = shared_http
 
-    def _switch_to_backup_key(self):
-        """Switch to backup key if available."""
-        if self.current_key_index < len(self.api_keys) - 1:
-            self.current_key_index += 1
-            logging.info(f"🔄 Switching to backup key #{self.current_key_index + 1}")
-            self._init_client()
-            return True
-        return False
+        self.clients = [
+            AsyncOpenAI(
+                base_url="https://openrouter.ai/api/v1",
+                api_key=key,
+                **client_kwargs,
+            )
+            for key in self.api_keys
+        ]
+        self._client_cursor = 0
+        # monotonic timestamps until which each key is benched after a 429
+        self._parked_until = [0.0] * len(self.clients)
+        # downgraded to plain json_object once a provider rejects json_schema
+        self._use_json_schema = True
+
+    def _next_client(self):
+        """
+        Round-robin pick of the next non-parked client.
+        When every key is parked — with a single key, one 429 benches the
+        whole pool — the least-parked one is returned anyway: free-tier
+        429s are usually per-model upstream limits, so other models on the
+        same key are still worth trying rather than failing the run into
+        the Google/mock fallbacks. Returns (None, None) only when no
+        clients are configured.
+        """
+        if not self.clients:
+            return None, None
+        now = time.monotonic()
+        for _ in range(len(self.clients)):
+            idx = self._client_cursor
+            self._client_cursor = (self._client_cursor + 1) % len(self.clients)
+            if self._parked_until[idx] <= now:
+                return idx, self.clients[idx]
+        idx = min(range(len(self.clients)), key=self._parked_until.__getitem__)
+        return idx, self.clients[idx]
+
+    def _park_key(self, idx: int, seconds: float = PARK_SECONDS):
+        """Bench a rate-limited key; round-robin prefers others until the window passes."""
+        self._parked_until[idx] = time.monotonic() + seconds
+        logging.info(f"⛔ Key #{idx + 1} rate-limited. Parked for {seconds:.0f}s.")
 
     def _generate_with_google_ai(self, system_prompt: str, user_prompt: str) -> dict:
         """Fallback to Google AI Studio (Gemini) when OpenRouter fails."""
@@ -89,15 +284,9 @@ class AstrologerAgent:
             full_prompt = f"{system_prompt}\n\n{user_prompt}"
             response = self.google_model.generate_content(full_prompt)
             
-            # Extract JSON from response
-            text = response.text
-            # Clean up markdown code blocks if present
-            if "```json" in text:
-                text = text.split("```json")[1].split("```")[0]
-            elif "```" in text:
-                text = text.split("```")[1].split("```")[0]
-            
-            result = json.loads(text.strip())
+            # Extract JSON from response in one regex pass (no chained
+            # split() copies, no IndexError on stray/absent fences)
+            result = fastjson.extract_json(response.text)
             logging.info("✅ Google AI Studio succeeded!")
             return result
             
@@ -112,49 +301,18 @@ class AstrologerAgent:
         """
         try:
             logging.info("🔎 Discovering best free models on OpenRouter...")
-            response = requests.get("https://openrouter.ai/api/v1/models")
-            if response.status_code != 200:
-                logging.warning("⚠️ Failed to fetch models list. Using defaults.")
-                return ["google/gemini-2.0-flash-exp:free", "meta-llama/llama-3.3-70b-instruct:free"]
-            
-            all_models = response.json().get("data", [])
-            free_models = []
-            
-            for m in all_models:
-                pricing = m.get("pricing", {})
-                if pricing.get("prompt") == "0" and pricing.get("completion") == "0":
-                    free_models.append(m["id"])
-            
-            # Smart Ranking Heuristics
-            # 1. Prefer 'gemini' (best for creative writing)
-            # 2. Prefer 'llama-3' (strong instruction following)
-            # 3. Prefer 'deepseek' (good reasoning)
-            # 4. Prefer larger models ('70b', 'flash')
-            # 5. Avoid tiny models ('nano', '1b', '3b')
-            
-            scored_models = []
-            for mid in free_models:
-                score = 0
-                mid_lower = mid.lower()
-                
-                if "gemini" in mid_lower: score += 10
-                if "llama-3" in mid_lower: score += 8
-                if "deepseek" in mid_lower: score += 7
-                if "phi-4" in mid_lower: score += 6
-                
-                if "flash" in mid_lower: score += 3
-                if "exp" in mid_lower: score += 2
-                if "70b" in mid_lower: score += 2
-                
-                if "nano" in mid_lower or "1b" in mid_lower or "3b" in mid_lower: score -= 20
-                
-                scored_models.append((score, mid))
-            
-            # Sort by score desc
-            scored_models.sort(key=lambda x: x[0], reverse=True)
-            
-            best_models = [m[1] for m in scored_models[:5]] # Take top 5
-            
+            # Cached fetch (memory + disk TTL) — repeated inits skip the network
+            all_models = fetch_openrouter_models()
+
+            # Free models feed straight into a bounded heap — no intermediate
+            # scored list and no full O(N log N) sort for a top-5 answer.
+            free_ids = (
+                m["id"] for m in all_models
+                if m.get("pricing", {}).get("prompt") == "0"
+                and m.get("pricing", {}).get("completion") == "0"
+            )
+            best_models = heapq.nlargest(5, free_ids, key=_score_model_id)
+
             logging.info(f"✅ Selected Top Free Models: {best_models}")
             if not best_models:
                  return ["google/gemini-2.0-flash-exp:free", "meta-llama/llama-3.3-70b-instruct:free"]
@@ -167,44 +325,139 @@ class AstrologerAgent:
             return ["google/gemini-2.0-flash-exp:free", "meta-llama/llama-3.3-70b-instruct:free"]
 
     def _generate_script(self, rashi: str, date: str, period_type: str, system_prompt: str, user_prompt: str) -> dict:
-        """Helper to try models in rotation with key failover on rate limits."""
-        errors = []
-        tried_backup = False
-        
-        while True:
-            for model in self.models:
-                logging.info(f"🤖 Casting {period_type} chart using: {model}")
-                try:
-                    response = self.client.chat.completions.create(
+        """Synchronous wrapper for _agenerate_script."""
+        return asyncio.run(self._agenerate_script(rashi, date, period_type, system_prompt, user_prompt))
+
+    @cached_property
+    def models(self) -> list:
+        """
+        Ranked free models, discovered lazily on first use.
+        Instantiating the agent no longer pays the discovery round trip —
+        callers that only ever hit the Google AI fallback pay nothing.
+        """
+        if not self.api_keys:
+            return []
+        return self.get_best_free_models()
+
+    def _response_format(self, schema: dict) -> dict:
+        """json_schema when a schema is given and still trusted, else json_object."""
+        if schema is not None and self._use_json_schema:
+            return {"type": "json_schema", "json_schema": schema}
+        return {"type": "json_object"}
+
+    async def _agenerate_script(self, rashi: str, date: str, period_type: str, system_prompt: str, user_prompt: str, schema: dict = None) -> dict:
+        """Single-flight entry point: identical concurrent requests share one call."""
+        flight_key = llm_cache.cache_key(period_type, [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt}
+        ])
+        return await llm_cache.single_flight(
+            flight_key,
+            lambda: self._agenerate_script_once(rashi, date, period_type, system_prompt, user_prompt, schema)
+        )
+
+    async def _atry_model(self, model: str, period_type: str, messages: list, schema: dict = None) -> dict:
+        """One model attempt: cache check, then the call, retrying across keys on 429."""
+        # Disk cache first: a prior run already paid for this exact request
+        cache_key = llm_cache.cache_key(model, messages)
+        cached = llm_cache.get(cache_key)
+        if cached is None and llm_cache.FUZZY_ENABLED:
+            # Near-duplicate fallback: same prompts modulo numeric tokens
+            cached = llm_cache.get(llm_cache.fuzzy_key(model, messages))
+        if cached is not None:
+            return cached
+
+        logging.info(f"🤖 Casting {period_type} chart using: {model}")
+        last_error = None
+
+        # Retry the same model on each remaining key if one gets rate-limited.
+        # The schema downgrade below retries in place WITHOUT drawing from
+        # this budget: it's a provider capability miss, not a quota hit —
+        # with one key it would otherwise eat the whole loop and abandon
+        # the model instead of retrying it with json_object.
+        key_attempts = 0
+        while key_attempts < max(len(self.clients), 1):
+            key_idx, client = self._next_client()
+            if client is None:
+                raise RuntimeError("No OpenRouter clients configured")
+
+            try:
+                # Throttle proactively instead of eating a 429 + retry cycle
+                async with openrouter_limiter:
+                    stream = await client.chat.completions.create(
                         model=model,
-                        messages=[
-                            {"role": "system", "content": system_prompt},
-                            {"role": "user", "content": user_prompt}
-                        ],
-                        response_format={"type": "json_object"}
+                        messages=messages,
+                        response_format=self._response_format(schema),
+                        stream=True
                     )
-                    
-                    raw_content = response.choices[0].message.content
-                    return json.loads(raw_content)
-                    
-                except Exception as e:
-                    error_str = str(e)
-                    logging.warning(f"⚠️ Model {model} failed: {e}")
-                    errors.append(f"{model}: {error_str}")
-                    
-                    # Check if it's a rate limit error (429)
-                    if "429" in error_str or "rate limit" in error_str.lower():
-                        # Try switching to backup key
-                        if not tried_backup and self._switch_to_backup_key():
-                            logging.info("🔄 Rate limit hit! Retrying with backup key...")
-                            tried_backup = True
-                            errors = []  # Reset errors for new key
-                            break  # Restart model loop with new key
+                    # Consume deltas as they arrive instead of blocking
+                    # on the full body (matters for Monthly/Yearly blobs)
+                    pieces = []
+                    async for chunk in stream:
+                        if chunk.choices and chunk.choices[0].delta.content:
+                            pieces.append(chunk.choices[0].delta.content)
+
+                raw_content = "".join(pieces)
+                result = fastjson.loads(raw_content)
+                llm_cache.set(cache_key, result)
+                if llm_cache.FUZZY_ENABLED:
+                    llm_cache.set(llm_cache.fuzzy_key(model, messages), result)
+                return result
+
+            except Exception as e:
+                error_str = str(e)
+                last_error = e
+                logging.warning(f"⚠️ Model {model} failed: {e}")
+
+                # Rate limit (429): park this key and retry on the next one
+                if "429" in error_str or "rate limit" in error_str.lower():
+                    self._park_key(key_idx, _park_duration(e))
+                    key_attempts += 1
                     continue
-            else:
-                # All models exhausted for current key
-                break
-        
+
+                # Provider rejected strict schemas: downgrade and retry the
+                # same request in place. Happens at most once per process —
+                # the flag flips permanently — so the loop can't spin.
+                if schema is not None and self._use_json_schema and \
+                        ("json_schema" in error_str.lower() or "response_format" in error_str):
+                    logging.info("↩️ Provider rejected json_schema. Falling back to json_object.")
+                    self._use_json_schema = False
+                    continue
+
+                raise  # Model-level failure: let the caller move on
+
+        raise last_error or RuntimeError(f"Model {model} exhausted all keys")
+
+    async def _agenerate_script_once(self, rashi: str, date: str, period_type: str, system_prompt: str, user_prompt: str, schema: dict = None) -> dict:
+        """Races the top models, walks the rest, then falls back to Google AI / mock data."""
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt}
+        ]
+
+        # Race the top 2 models concurrently: the first success wins and the
+        # straggler is cancelled. Free-tier latencies vary wildly per model,
+        # so this bounds the critical path by the faster of the two.
+        racers = [asyncio.create_task(self._atry_model(m, period_type, messages, schema))
+                  for m in self.models[:2]]
+        pending = set(racers)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+        # Both racers failed: fall through the remaining models sequentially
+        for model in self.models[2:]:
+            try:
+                return await self._atry_model(model, period_type, messages, schema)
+            except Exception:
+                continue
+
         # FINAL FALLBACK: Try Google AI Studio
         logging.warning("⚠️ All OpenRouter models/keys exhausted. Trying Google AI fallback...")
         google_result = self._generate_with_google_ai(system_prompt, user_prompt)
@@ -239,83 +492,85 @@ class AstrologerAgent:
         }
 
     def generate_daily_rashifal(self, rashi: str, date: str) -> dict:
+        """Synchronous wrapper for agenerate_daily_rashifal."""
+        return asyncio.run(self.agenerate_daily_rashifal(rashi, date))
+
+    async def agenerate_daily_rashifal(self, rashi: str, date: str) -> dict:
         """Generates Daily Horoscope."""
         logging.info(f"✨ Astrologer: Generating Daily Horoscope for {rashi}...")
-        
-        system_prompt = """
-        You are 'Rishiraj', an expert Vedic Astrologer. Tone: Mystical, Positive, Authoritative.
-        Write a DAILY Horoscope Script in PURE HINDI.
-        Do NOT mention specific dates.
+        return await self._agenerate_script(rashi, date, "Daily",
+                                            DAILY_SYSTEM_PROMPT,
+                                            DAILY_USER_TMPL % (rashi, date),
+                                            schema=DAILY_SCHEMA)
+
+    def generate_all_daily(self, rashis: list = None, date: str = None) -> dict:
+        """Synchronous wrapper for agenerate_all_daily."""
+        return asyncio.run(self.agenerate_all_daily(rashis, date))
+
+    async def agenerate_all_daily(self, rashis: list = None, date: str = None) -> dict:
         """
-        
-        user_prompt = f"""
-        Generate a **Daily Horoscope** for **{rashi}** for {date}.
-        Return ONLY valid JSON:
-        {{
-            "hook": "Short attention grabber (Hindi)",
-            "intro": "Astrological context (Gochar)",
-            "love": "Love prediction",
-            "career": "Career prediction",
-            "money": "Financial prediction",
-            "health": "Health prediction",
-            "remedy": "Specific Vedic remedy",
-            "lucky_color": "Color",
-            "lucky_number": "Number"
-        }}
+        Generates Daily Horoscopes for ALL rashis in a single completion.
+        Batching trades 12 requests (RPM-bound) for one bigger request
+        (TPM-bound), which is where the free-tier headroom actually is.
+        Returns {rashi: script_dict}.
         """
-        return self._generate_script(rashi, date, "Daily", system_prompt, user_prompt)
+        rashis = rashis or RASHIS
+        logging.info(f"✨ Astrologer: Generating batched Daily Horoscope for {len(rashis)} rashis...")
+        result = await self._agenerate_script("All Rashis", date, "Daily (Batched)",
+                                              ALL_DAILY_SYSTEM_PROMPT,
+                                              ALL_DAILY_USER_TMPL % (", ".join(rashis), date))
+
+        # Split by key; tolerate the model keying by the short name ("Mesh")
+        scripts = {}
+        for rashi in rashis:
+            short_name = rashi.split("(")[0].strip()
+            script = result.get(rashi) or result.get(short_name)
+            if not isinstance(script, dict) or not script:
+                logging.warning(f"⚠️ Batched response missing '{rashi}'. Using mock data.")
+                script = self._get_mock_data(rashi, "Daily")
+            scripts[rashi] = script
+        return scripts
 
     def generate_monthly_forecast(self, rashi: str, month_year: str) -> dict:
+        """Synchronous wrapper for agenerate_monthly_forecast."""
+        return asyncio.run(self.agenerate_monthly_forecast(rashi, month_year))
+
+    async def agenerate_monthly_forecast(self, rashi: str, month_year: str) -> dict:
         """Generates Monthly Horoscope (Detailed)."""
         logging.info(f"✨ Astrologer: Generating Monthly Horoscope for {rashi} ({month_year})...")
-        
-        system_prompt = """
-        You are 'Rishiraj', an expert Vedic Astrologer. Tone: Detailed, Predictive, Guiding.
-        Write a MONTHLY Horoscope Script in PURE HINDI.
-        Focus on major planetary shifts (Sun transit, Moon phases).
-        """
-        
-        user_prompt = f"""
-        Generate a **Monthly Horoscope** for **{rashi}** for **{month_year}**.
-        Return ONLY valid JSON:
-        {{
-            "hook": "Major theme of the month (Hindi)",
-            "intro": "Overview of the month & planetary changes",
-            "love": "Detailed Relationship forecast",
-            "career": "Detailed Career & Business forecast",
-            "money": "Financial opportunities & risks",
-            "health": "Health warnings",
-            "remedy": "Major monthly remedy (Upay)",
-            "lucky_dates": "List of lucky dates"
-        }}
-        """
-        return self._generate_script(rashi, month_year, "Monthly", system_prompt, user_prompt)
+        return await self._agenerate_script(rashi, month_year, "Monthly",
+                                            MONTHLY_SYSTEM_PROMPT,
+                                            MONTHLY_USER_TMPL % (rashi, month_year),
+                                            schema=MONTHLY_SCHEMA)
 
     def generate_yearly_forecast(self, rashi: str, year: str) -> dict:
-        """Generates Yearly 2025+ Horoscope (Grand)."""
+        """Synchronous wrapper for agenerate_yearly_forecast."""
+        return asyncio.run(self.agenerate_yearly_forecast(rashi, year))
+
+    async def agenerate_yearly_forecast(self, rashi: str, year: str) -> dict:
+        """Generates Yearly Horoscope (Grand)."""
         logging.info(f"✨ Astrologer: Generating Yearly Horoscope for {rashi} ({year})...")
-        
-        system_prompt = """
-        You are 'Rishiraj', the Grand Vedic Astrologer. Tone: Epic, Visionary, Comprehensive.
-        Write a YEARLY 'Varshiphal' Script in PURE HINDI.
-        Focus on Jupiter (Guru), Saturn (Shani), and Rahu/Ketu transits.
+        return await self._agenerate_script(rashi, year, "Yearly",
+                                            YEARLY_SYSTEM_PROMPT,
+                                            YEARLY_USER_TMPL % (rashi, year),
+                                            schema=YEARLY_SCHEMA)
+
+    async def generate_all_rashis(self, date: str, period_type: str = "Daily") -> dict:
         """
-        
-        user_prompt = f"""
-        Generate a **Yearly Horoscope** for **{rashi}** for the year **{year}**.
-        Return ONLY valid JSON:
-        {{
-            "hook": "The biggest theme of the year (Hindi)",
-            "intro": "Grand overview of 2025 for this sign",
-            "love": "Love life analysis for the whole year",
-            "career": "Career growth analysis",
-            "money": "Wealth accumulation forecast",
-            "health": "Major health periods to watch",
-            "remedy": "Maha-Upay (Grand Remedy) for the year",
-            "lucky_months": "Best months of the year"
-        }}
+        Generates horoscopes for all 12 rashis concurrently.
+        LLM calls are pure I/O, so gathering collapses 12x latency to ~1x.
+        Returns {rashi: script_dict}; failed rashis map to the raised exception.
         """
-        return self._generate_script(rashi, year, "Yearly", system_prompt, user_prompt)
+        generators = {
+            "Daily": self.agenerate_daily_rashifal,
+            "Monthly": self.agenerate_monthly_forecast,
+            "Yearly": self.agenerate_yearly_forecast,
+        }
+        generate = generators.get(period_type, self.agenerate_daily_rashifal)
+
+        logging.info(f"✨ Astrologer: Generating {period_type} Horoscopes for all 12 Rashis in parallel...")
+        results = await asyncio.gather(*(generate(r, date) for r in RASHIS), return_exceptions=True)
+        return dict(zip(RASHIS, results))
 
 # Test Run (Uncomment to test)
 # if __name__ == "__main__":
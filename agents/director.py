@@ -1,9 +1,8 @@
 import os
-import json
+import asyncio
 import logging
-import requests
-from openai import OpenAI
-from dotenv import load_dotenv
+import random
+from openai import AsyncOpenAI
 
 # Try to import Google AI
 try:
@@ -12,10 +11,57 @@ try:
 except ImportError:
     GOOGLE_AI_AVAILABLE = False
 
-# Load environment variables
-load_dotenv()
+# Logging and .env loading are handled once in agents/__init__.py
+from agents import fastjson, llm_cache
+from agents.http import get_shared_http_client
+from agents.model_discovery import fetch_openrouter_models
+from agents.rate_limit import openrouter_limiter
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+DIRECTOR_SYSTEM_PROMPT = """
+You are a Christopher Nolan-esque Film Director.
+You transform simple text into CINEMATIC VISUALS.
+
+Your Goal: Select STOCK FOOTAGE keywords that match the emotion but are NOT cheesy.
+
+Rules for Keywords:
+1. Always English.
+2. Visual, Atmospheric, High Quality.
+3. NO text on screen descriptions.
+4. Examples:
+   - Bad: "Sad man" -> Good: "Silhouette in rain window reflection dark, moody"
+   - Bad: "Money" -> Good: "Golden coins falling slow motion cinematic lighting"
+   - Bad: "Love" -> Good: "Couple holding hands sunset silhouette beach"
+"""
+
+FALLBACK_SCENE = "Abstract golden particles slow motion"
+
+# A hung request should fail fast into the fallback chain, not stall the
+# whole render. Retries are our own (backoff below), so the SDK's are off.
+REQUEST_TIMEOUT = 15.0   # seconds, per OpenRouter request
+GOOGLE_TIMEOUT = 20      # seconds, Gemini fallback
+DEFAULT_MAX_TOKENS = 512  # mood/screenplay JSON never needs more
+
+# 429 backoff: exponential with jitter, capped so a burst of retries
+# never stalls the pipeline for more than a minute per call
+BACKOFF_BASE = 1.0   # seconds
+BACKOFF_CAP = 60.0   # seconds
+MAX_429_RETRIES = 6
+
+
+def _retry_delay(error, attempt: int) -> float:
+    """Delay before retrying a 429: the server's Retry-After when given,
+    else exponential backoff with jitter (so parallel calls don't re-slam
+    the API in lockstep)."""
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if headers:
+        retry_after = headers.get("Retry-After") or headers.get("retry-after")
+        try:
+            if retry_after is not None:
+                return min(float(retry_after), BACKOFF_CAP)
+        except (TypeError, ValueError):
+            pass
+    delay = BACKOFF_BASE * (2 ** (attempt - 1))
+    return min(delay + random.uniform(0, delay / 2), BACKOFF_CAP)
 
 class DirectorAgent:
     """
@@ -60,10 +106,27 @@ class DirectorAgent:
             self.models = []
 
     def _init_client(self):
-        """Initialize OpenAI client with current key."""
-        self.client = OpenAI(
+        """Initialize async OpenAI client with current key.
+
+        The client (and its connection pool) is created once; key switches
+        only swap the api_key so warm connections are kept alive.
+        """
+        if getattr(self, "client", None) is not None:
+            self.client.api_key = self.api_keys[self.current_key_index]
+            return
+
+        client_kwargs = {}
+        # Share one aiohttp pool with every other OpenRouter client
+        shared_http = get_shared_http_client()
+        if shared_http is not None:
+            client_kwargs["http_client"] = shared_http
+
+        self.client = AsyncOpenAI(
             base_url="https://openrouter.ai/api/v1",
             api_key=self.api_keys[self.current_key_index],
+            timeout=REQUEST_TIMEOUT,
+            max_retries=0,
+            **client_kwargs,
         )
 
     def _switch_to_backup_key(self):
@@ -83,31 +146,30 @@ class DirectorAgent:
         logging.info("🌟 Director: Trying Google AI Studio (Gemini) as fallback...")
         try:
             full_prompt = f"{system_prompt}\n\n{user_prompt}"
-            response = self.google_model.generate_content(full_prompt)
-            
-            text = response.text
-            if "```json" in text:
-                text = text.split("```json")[1].split("```")[0]
-            elif "```" in text:
-                text = text.split("```")[1].split("```")[0]
+            response = self.google_model.generate_content(
+                full_prompt, request_options={"timeout": GOOGLE_TIMEOUT})
             
-            result = json.loads(text.strip())
+            # One regex pass instead of chained split() copies, which also
+            # raised IndexError on stray/absent fences and dumped perfectly
+            # valid JSON into the hardcoded fallback
+            result = fastjson.extract_json(response.text)
             logging.info("✅ Director: Google AI Studio succeeded!")
             return result
             
         except Exception as e:
             logging.error(f"❌ Director: Google AI Studio failed: {e}")
-            return {"mood": "Peaceful", "scenes": {k: "Abstract golden particles slow motion" for k in sections}}
+            return {"mood": "Peaceful", "scenes": {k: FALLBACK_SCENE for k in sections}}
 
-    def _get_best_free_models(self) -> list:
-        """Discovers best free models on OpenRouter."""
+    def _get_best_free_models(self, force_refresh: bool = False) -> list:
+        """Discovers best free models on OpenRouter.
+
+        Reads the shared model catalog (memory + 24h disk cache in
+        model_discovery), so instantiating the Director after the
+        Astrologer costs no extra network round trip.
+        """
         try:
             logging.info("🎬 Director: Discovering best free models...")
-            response = requests.get("https://openrouter.ai/api/v1/models", timeout=10)
-            if response.status_code != 200:
-                return ["google/gemini-2.0-flash-exp:free"]
-            
-            all_models = response.json().get("data", [])
+            all_models = fetch_openrouter_models(force_refresh=force_refresh)
             free_models = []
             
             for m in all_models:
@@ -135,44 +197,156 @@ class DirectorAgent:
             logging.warning(f"Model discovery failed: {e}")
             return ["google/gemini-2.0-flash-exp:free"]
 
+    async def _acomplete(self, system_prompt: str, user_prompt: str, max_tokens: int = None,
+                         response_format: dict = None) -> str:
+        """
+        One completion against the model list, with key failover on 429.
+        Returns the raw content string; raises when everything is exhausted.
+        """
+        tried_backup = False
+        attempts_429 = 0
+
+        while True:
+            for model in self.models:
+                try:
+                    logging.info(f"🎬 Director: Trying model {model}...")
+                    kwargs = {"max_tokens": max_tokens or DEFAULT_MAX_TOKENS}
+                    if response_format:
+                        kwargs["response_format"] = response_format
+
+                    # Throttle proactively instead of eating a 429 + retry cycle
+                    async with openrouter_limiter:
+                        response = await self.client.chat.completions.create(
+                            model=model,
+                            messages=[
+                                {"role": "system", "content": system_prompt},
+                                {"role": "user", "content": user_prompt}
+                            ],
+                            **kwargs
+                        )
+
+                    return response.choices[0].message.content
+
+                except Exception as e:
+                    error_str = str(e)
+                    logging.warning(f"⚠️ Director model {model} failed: {e}")
+
+                    # Check if it's a rate limit error (429)
+                    if "429" in error_str or "rate limit" in error_str.lower():
+                        if not tried_backup and self._switch_to_backup_key():
+                            logging.info("🔄 Rate limit hit! Retrying with backup key...")
+                            tried_backup = True
+                            break  # Restart model loop with new key
+                        attempts_429 += 1
+                        if attempts_429 <= MAX_429_RETRIES:
+                            delay = _retry_delay(e, attempts_429)
+                            logging.info(f"⏳ Director: rate limited, backing off {delay:.1f}s "
+                                         f"(retry {attempts_429}/{MAX_429_RETRIES})")
+                            await asyncio.sleep(delay)
+                            break  # Restart model loop after cooling down
+                    continue
+            else:
+                # All models exhausted
+                break
+
+        raise RuntimeError("All OpenRouter models/keys exhausted")
+
+    async def _ascene_for(self, section: str, text: str) -> str:
+        """Tiny per-section completion: one cinematic stock-footage keyword phrase."""
+        user_prompt = (
+            f"This is the '{section}' section of a Hindi horoscope script:\n{text}\n\n"
+            "Reply with ONE cinematic English stock-footage keyword phrase. Nothing else."
+        )
+        keyword = await self._acomplete(DIRECTOR_SYSTEM_PROMPT, user_prompt, max_tokens=30)
+        return keyword.strip().strip('"')
+
+    async def _amood_for(self, full_script_text: str) -> dict:
+        """Small completion deciding the overall mood and music style."""
+        user_prompt = f"""
+        Analyze the overall emotion of this Hindi Horoscope Script.
+
+        Script Context: {full_script_text}
+
+        Return ONLY a JSON object with this structure:
+        {{
+            "mood": "Mysterious" | "Energetic" | "Peaceful" | "Dark",
+            "music_style": "Ambient Drone" | "Upbeat classical" | "Deep meditation"
+        }}
+        """
+        raw = await self._acomplete(DIRECTOR_SYSTEM_PROMPT, user_prompt,
+                                    response_format={"type": "json_object"})
+        return fastjson.loads(raw)
+
     def create_screenplay(self, script_data) -> dict:
+        """Synchronous wrapper for acreate_screenplay."""
+        return asyncio.run(self.acreate_screenplay(script_data))
+
+    async def acreate_screenplay(self, script_data) -> dict:
         """
         Analyzes the horoscope script and generates a shot list.
-        Handles both dict and list script formats.
+        Each section gets its own tiny completion and all of them (plus the
+        mood call) run concurrently — no single giant prompt on the
+        critical path. Handles both dict and list script formats.
         """
         logging.info("🎬 Director: visualizing the script...")
-        
+
         sections = ["intro", "love", "career", "money", "health", "remedy"]
-        
+
         # Handle different input types
         if isinstance(script_data, dict):
-            full_script_text = " ".join([str(script_data.get(k, "")) for k in sections])
+            section_texts = {k: str(script_data[k]) for k in sections if script_data.get(k)}
         elif isinstance(script_data, list):
-            full_script_text = " ".join([str(item) for item in script_data if item])
+            section_texts = {"intro": " ".join(str(item) for item in script_data if item)}
         else:
-            full_script_text = str(script_data)
-        
-        system_prompt = """
-        You are a Christopher Nolan-esque Film Director.
-        You transform simple text into CINEMATIC VISUALS.
-        
-        Your Goal: Select STOCK FOOTAGE keywords that match the emotion but are NOT cheesy.
-        
-        Rules for Keywords:
-        1. Always English.
-        2. Visual, Atmospheric, High Quality.
-        3. NO text on screen descriptions.
-        4. Examples:
-           - Bad: "Sad man" -> Good: "Silhouette in rain window reflection dark, moody"
-           - Bad: "Money" -> Good: "Golden coins falling slow motion cinematic lighting"
-           - Bad: "Love" -> Good: "Couple holding hands sunset silhouette beach"
-        """
-        
+            section_texts = {"intro": str(script_data)}
+
+        full_script_text = " ".join(section_texts.values())
+
+        # Exact-match screenplay cache: the same script always cuts the same
+        # shot list, so a rerun skips the whole completion fan-out.
+        cache_key = llm_cache.cache_key("screenplay", [{"role": "user", "content": full_script_text}])
+        cached = llm_cache.get(cache_key)
+        if cached is not None:
+            logging.info("🎬 Director: reusing cached screenplay")
+            return cached
+
+        results = await asyncio.gather(
+            self._amood_for(full_script_text),
+            *(self._ascene_for(s, t) for s, t in section_texts.items()),
+            return_exceptions=True
+        )
+
+        mood_info = results[0] if isinstance(results[0], dict) else None
+        scenes = {k: FALLBACK_SCENE for k in sections}
+        scenes_ok = True
+        for section, result in zip(section_texts, results[1:]):
+            if isinstance(result, str) and result:
+                scenes[section] = result
+            else:
+                scenes_ok = False
+
+        if mood_info:
+            screenplay = {
+                "mood": mood_info.get("mood", "Peaceful"),
+                "music_style": mood_info.get("music_style", "Ambient Drone"),
+                "scenes": scenes
+            }
+            # Only full successes get cached: the mood call alone getting
+            # through while sections fell back would otherwise pin a
+            # FALLBACK_SCENE shot list for the whole TTL window.
+            if scenes_ok:
+                llm_cache.set(cache_key, screenplay)
+            else:
+                logging.info("🎬 Director: scenes degraded, skipping screenplay cache")
+            return screenplay
+
+        # FINAL FALLBACK: Try Google AI Studio with the original one-shot prompt
+        logging.warning("⚠️ Director: All OpenRouter models/keys exhausted. Trying Google AI...")
         user_prompt = f"""
         Analyze this Hindi Horoscope Script and generate a JSON Screenplay.
-        
+
         Script Context: {full_script_text}
-        
+
         Return ONLY a JSON object with this structure:
         {{
             "mood": "Mysterious" | "Energetic" | "Peaceful" | "Dark",
@@ -187,48 +361,13 @@ class DirectorAgent:
             }}
         }}
         """
-
-        tried_backup = False
-        
-        while True:
-            for model in self.models:
-                try:
-                    logging.info(f"🎬 Director: Trying model {model}...")
-                    response = self.client.chat.completions.create(
-                        model=model,
-                        messages=[
-                            {"role": "system", "content": system_prompt},
-                            {"role": "user", "content": user_prompt}
-                        ],
-                        response_format={"type": "json_object"}
-                    )
-                    
-                    return json.loads(response.choices[0].message.content)
-                    
-                except Exception as e:
-                    error_str = str(e)
-                    logging.warning(f"⚠️ Director model {model} failed: {e}")
-                    
-                    # Check if it's a rate limit error (429)
-                    if "429" in error_str or "rate limit" in error_str.lower():
-                        if not tried_backup and self._switch_to_backup_key():
-                            logging.info("🔄 Rate limit hit! Retrying with backup key...")
-                            tried_backup = True
-                            break  # Restart model loop with new key
-                    continue
-            else:
-                # All models exhausted
-                break
-        
-        # FINAL FALLBACK: Try Google AI Studio
-        logging.warning("⚠️ Director: All OpenRouter models/keys exhausted. Trying Google AI...")
-        google_result = self._generate_with_google_ai(system_prompt, user_prompt, sections)
+        google_result = self._generate_with_google_ai(DIRECTOR_SYSTEM_PROMPT, user_prompt, sections)
         if google_result:
             return google_result
-        
+
         # Ultimate fallback visuals
         logging.error("❌ All Director models/keys/fallbacks failed. Using hardcoded visuals.")
         return {
             "mood": "Peaceful",
-            "scenes": {k: "Abstract golden particles slow motion" for k in sections}
+            "scenes": {k: FALLBACK_SCENE for k in sections}
         }
@@ -0,0 +1,55 @@
+"""
+Fastest available JSON codec for the hot path.
+
+orjson parses/serializes the ~1-3 KB LLM blobs several times faster than
+stdlib json and works directly in bytes, skipping an encode/decode round
+trip for hashing and disk I/O. It stays optional: everything falls back
+to stdlib json when it isn't installed.
+"""
+import re
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# LLM replies wrap JSON in ``` fences more often than not; one compiled
+# regex pass beats chained split() copies and can't IndexError on stray
+# or absent fences.
+JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(\{.*\})\s*```", re.S)
+_BRACES_RE = re.compile(r"\{.*\}", re.S)
+
+
+def loads(data):
+    """Parse JSON from str or bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, bytes):
+        data = data.decode("utf-8")
+    return json.loads(data)
+
+
+def dumps_bytes(obj, sort_keys: bool = False) -> bytes:
+    """Serialize to UTF-8 bytes (hash- and file-ready)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS if sort_keys else 0)
+    return json.dumps(obj, sort_keys=sort_keys, ensure_ascii=False).encode("utf-8")
+
+
+def extract_json(text: str):
+    """
+    Parses the first JSON object out of an LLM reply: a fenced ```json
+    block when present, the bare text otherwise, and as a last resort the
+    outermost {...} span (models love prose around their JSON).
+    """
+    match = JSON_FENCE_RE.search(text)
+    if match:
+        return loads(match.group(1))
+    try:
+        return loads(text.strip())
+    except Exception:
+        match = _BRACES_RE.search(text)
+        if match:
+            return loads(match.group(0))
+        raise
@@ -0,0 +1,51 @@
+"""
+Shared async HTTP transport for all OpenRouter clients.
+
+Every AsyncOpenAI instance would otherwise spin up its own connector and
+pay DNS + TLS handshakes separately. Auth headers are applied per request
+by the SDK, so Astrologer and Director (and every per-key client) can all
+ride one warm connection pool.
+"""
+import atexit
+import asyncio
+import logging
+
+# Needs the openai[aiohttp] extra; falls back to per-client httpx otherwise.
+# The import alone proves nothing: in openai >= 1.82 the class always
+# imports and raises RuntimeError at construction when aiohttp is missing,
+# so availability is decided on the first construction attempt below.
+try:
+    from openai import DefaultAioHttpClient
+except ImportError:
+    DefaultAioHttpClient = None
+
+_shared_client = None
+_unavailable = DefaultAioHttpClient is None
+
+
+def get_shared_http_client():
+    """Returns the process-wide aiohttp-backed transport, or None when unavailable."""
+    global _shared_client, _unavailable
+    if _unavailable:
+        return None
+    if _shared_client is None:
+        try:
+            _shared_client = DefaultAioHttpClient()
+        except RuntimeError as e:
+            logging.info(f"ℹ️ aiohttp transport unavailable ({e}); using per-client httpx")
+            _unavailable = True
+            return None
+        atexit.register(_close_shared_client)
+    return _shared_client
+
+
+def _close_shared_client():
+    """Close the pool once at process exit (sessions should not leak connectors)."""
+    global _shared_client
+    if _shared_client is None:
+        return
+    try:
+        asyncio.run(_shared_client.aclose())
+    except Exception as e:
+        logging.debug(f"Shared HTTP client close failed: {e}")
+    _shared_client = None
@@ -0,0 +1,108 @@
+"""
+Persistent on-disk cache for LLM responses.
+
+A horoscope for a given (model, prompts) pair is effectively deterministic
+content, yet every rerun re-pays full LLM latency and token cost. Entries
+are small JSON files keyed by SHA-256 of the exact request payload, so
+regenerating during development hits disk instead of the API.
+"""
+import os
+import re
+import time
+import asyncio
+import hashlib
+import logging
+
+from agents import fastjson
+
+# Logging is configured once in agents/__init__.py
+
+CACHE_DIR = os.getenv("LLM_CACHE_DIR", ".llm_cache")
+CACHE_TTL = int(os.getenv("LLM_CACHE_TTL", 24 * 3600))  # seconds; <= 0 disables the cache
+
+# Hit-rate bookkeeping (logged on every hit)
+_stats = {"hits": 0, "misses": 0}
+
+
+def cache_key(model: str, messages: list) -> str:
+    """Stable SHA-256 over the exact request payload (model + messages)."""
+    payload = fastjson.dumps_bytes({"model": model, "messages": messages}, sort_keys=True)
+    return hashlib.sha256(payload).hexdigest()
+
+
+def _entry_path(key: str) -> str:
+    return os.path.join(CACHE_DIR, f"{key}.json")
+
+
+# --- Near-duplicate cache keys ---------------------------------------------
+# Prompts for adjacent days (or reruns with a tweaked date) differ only in
+# numeric tokens. Normalizing digits away before hashing lets those hit the
+# same entry. Opt-in via LLM_CACHE_FUZZY=1: for daily content, serving the
+# previous day's script is a product decision, not just an optimization.
+FUZZY_ENABLED = os.getenv("LLM_CACHE_FUZZY", "0") == "1"
+_DIGITS_RE = re.compile(r"\d+")
+
+
+def fuzzy_key(model: str, messages: list) -> str:
+    """cache_key over the messages with all numeric tokens normalized away."""
+    normalized = [dict(m, content=_DIGITS_RE.sub("#", str(m.get("content", "")))) for m in messages]
+    return cache_key(f"fuzzy:{model}", normalized)
+
+
+def get(key: str):
+    """Returns the cached parsed JSON for key, or None on miss/expiry."""
+    if CACHE_TTL <= 0:
+        return None
+    path = _entry_path(key)
+    try:
+        if os.path.exists(path) and (time.time() - os.path.getmtime(path)) < CACHE_TTL:
+            with open(path, "rb") as f:
+                result = fastjson.loads(f.read())
+            _stats["hits"] += 1
+            total = _stats["hits"] + _stats["misses"]
+            logging.info(f"💾 LLM cache HIT ({_stats['hits']}/{total} lookups)")
+            return result
+    except Exception as e:
+        logging.warning(f"⚠️ LLM cache read failed: {e}")
+    _stats["misses"] += 1
+    return None
+
+
+def set(key: str, value: dict):
+    """Stores a parsed response under key. Failures only cost the cache, never the call."""
+    if CACHE_TTL <= 0:
+        return
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(_entry_path(key), "wb") as f:
+            f.write(fastjson.dumps_bytes(value))
+    except Exception as e:
+        logging.warning(f"⚠️ LLM cache write failed: {e}")
+
+
+# --- Single-flight coalescing ---------------------------------------------
+# Covers the window where a response is being generated but not yet
+# committed to disk: identical concurrent requests await the one call
+# already in flight instead of each going out to the API.
+_inflight = {}
+
+
+async def single_flight(key: str, coro_factory):
+    """Runs coro_factory() once per key; concurrent duplicates share the result."""
+    existing = _inflight.get(key)
+    if existing is not None:
+        logging.info("🤝 Coalescing duplicate in-flight LLM request")
+        return await existing
+
+    future = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    try:
+        result = await coro_factory()
+        future.set_result(result)
+        return result
+    except Exception as e:
+        future.set_exception(e)
+        future.exception()  # mark retrieved even when no duplicate awaited it
+        raise
+    finally:
+        _inflight.pop(key, None)
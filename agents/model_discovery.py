@@ -2,16 +2,69 @@
 Model Discovery Agent - Automatically finds the best free model on OpenRouter.
 """
 import os
+import json
+import time
 import requests
 import logging
-from dotenv import load_dotenv
+from functools import lru_cache
 
-load_dotenv()
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+# Logging and .env loading are handled once in agents/__init__.py
 
 # Cache the model to avoid repeated API calls
 _cached_model = None
 
+MODELS_URL = "https://openrouter.ai/api/v1/models"
+MODELS_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "openrouter_models.json")
+MODELS_CACHE_TTL = 24 * 3600  # The model list is nearly static; 24h is plenty fresh.
+
+# Shared session so repeated fetches reuse one connection pool
+_session = requests.Session()
+
+
+@lru_cache(maxsize=4)
+def _fetch_models_bucketed(hour_bucket: int) -> tuple:
+    """Fetches the raw OpenRouter model list, at most once per hour bucket."""
+    # 1. Fresh disk cache -> cold starts skip the network entirely
+    try:
+        if os.path.exists(MODELS_CACHE_FILE):
+            age = time.time() - os.path.getmtime(MODELS_CACHE_FILE)
+            if age < MODELS_CACHE_TTL:
+                with open(MODELS_CACHE_FILE, "r", encoding="utf-8") as f:
+                    return tuple(json.load(f))
+    except Exception as e:
+        logging.warning(f"⚠️ Model cache read failed: {e}")
+
+    # 2. Network fetch via the pooled session
+    response = _session.get(MODELS_URL, timeout=10)
+    response.raise_for_status()
+    data = response.json().get("data", [])
+
+    # 3. Persist for future cold starts
+    try:
+        os.makedirs(os.path.dirname(MODELS_CACHE_FILE), exist_ok=True)
+        with open(MODELS_CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+    except Exception as e:
+        logging.warning(f"⚠️ Model cache write failed: {e}")
+
+    return tuple(data)
+
+
+def fetch_openrouter_models(force_refresh: bool = False) -> list:
+    """
+    Returns the OpenRouter model list.
+    Cached in memory (per hour bucket) and on disk (24h TTL), so repeated
+    agent instantiations don't re-pay the network round trip.
+    force_refresh drops both caches and refetches.
+    """
+    if force_refresh:
+        _fetch_models_bucketed.cache_clear()
+        try:
+            os.remove(MODELS_CACHE_FILE)
+        except OSError:
+            pass
+    return list(_fetch_models_bucketed(int(time.time() // 3600)))
+
 def get_best_free_model(api_key: str = None) -> str:
     """
     Fetches the list of models from OpenRouter and returns the best free model.
@@ -4,7 +4,7 @@ import asyncio
 import edge_tts
 import logging
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+# Logging and .env loading are handled once in agents/__init__.py
 
 class NarratorAgent:
     """
@@ -27,18 +27,26 @@ class NarratorAgent:
         try:
             communicate = edge_tts.Communicate(text, self.voice, rate=self.rate, pitch=self.pitch)
             subtitles = []
-            
+            audio_buf = bytearray()
+
+            # Buffer the stream in memory: a blocking file.write per audio
+            # chunk would stall the event loop (and every concurrent
+            # narration in the batch) mid-stream. A section is ~1MB, so one
+            # write at the end is cheap and keeps the loop free while the
+            # network stream is live.
+            async for chunk in communicate.stream():
+                if chunk["type"] == "audio":
+                    audio_buf += chunk["data"]
+                elif chunk["type"] == "WordBoundary":
+                    subtitles.append({
+                        "text": chunk["text"],
+                        "start": chunk["offset"] / 10000000, # 100ns units to seconds
+                        "duration": chunk["duration"] / 10000000
+                    })
+
             with open(output_path, "wb") as file:
-                async for chunk in communicate.stream():
-                    if chunk["type"] == "audio":
-                        file.write(chunk["data"])
-                    elif chunk["type"] == "WordBoundary":
-                        subtitles.append({
-                            "text": chunk["text"],
-                            "start": chunk["offset"] / 10000000, # 100ns units to seconds
-                            "duration": chunk["duration"] / 10000000
-                        })
-            
+                file.write(audio_buf)
+
             # Save subtitles
             if subtitles:
                 with open(subtitle_path, "w", encoding="utf-8") as f:
@@ -54,6 +62,20 @@ class NarratorAgent:
             logging.error(f"❌ Narrator Failed: {e}")
             return False
 
+    async def agenerate_audio_batch(self, items: list) -> list:
+        """Narrates every (text, output_path) pair concurrently."""
+        return await asyncio.gather(*(self.generate_audio(t, p) for t, p in items))
+
+    def generate_audio_batch(self, items: list) -> list:
+        """
+        Narrates a batch of (text, output_path) pairs under ONE event loop.
+        Calling speak() per section paid a fresh loop + Edge-TTS TLS
+        handshake each time; one gather overlaps all the network waits.
+        Returns the per-item success flags in order.
+        """
+        return asyncio.run(self.agenerate_audio_batch(items))
+
     def speak(self, text: str, output_path: str):
-        """Synchronous wrapper for async speak."""
+        """Synchronous wrapper for a single narration.
+        Prefer generate_audio_batch when narrating several sections."""
         asyncio.run(self.generate_audio(text, output_path))
@@ -0,0 +1,51 @@
+"""
+Proactive async rate limiting for OpenRouter calls.
+
+Reacting to 429s after the fact wastes a full request/retry cycle each
+time. A token bucket sized to the account's RPM keeps a burst of
+concurrent calls (12 rashis x several periods) under the limit up front.
+"""
+import os
+import time
+import asyncio
+
+
+class AsyncTokenBucket:
+    """Minimal async token bucket: `async with bucket:` blocks until a slot frees."""
+
+    def __init__(self, max_rate: int, time_period: float = 60.0):
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._level = float(max_rate)
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._level = min(float(self.max_rate),
+                          self._level + (now - self._last_refill) * (self.max_rate / self.time_period))
+        self._last_refill = now
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._level >= 1.0:
+                    self._level -= 1.0
+                    return
+                # Sleep just long enough for the next token to drip in
+                await asyncio.sleep((1.0 - self._level) * (self.time_period / self.max_rate))
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+# OpenRouter free tier allows roughly 20 requests/minute per key
+OPENROUTER_RPM = int(os.getenv("OPENROUTER_RPM", 20))
+
+# One shared bucket per process — all agents draw from the same account quota
+openrouter_limiter = AsyncTokenBucket(OPENROUTER_RPM)
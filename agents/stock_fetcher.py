@@ -1,33 +1,108 @@
 import os
+import json
+import time
+import asyncio
 import requests
 import logging
-from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-load_dotenv()
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+# aiohttp ships with the openai[aiohttp] extra; guard it like google.generativeai
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+# Logging and .env loading are handled once in agents/__init__.py
+
+# 64KiB chunks: 8x fewer Python-level write calls than the old 8KiB
+DOWNLOAD_CHUNK = 1 << 16
+
+# Search results barely move day to day, and the free tier allows only
+# 200 requests/hr — repeated Director keywords (the hardcoded fallback
+# scene especially) shouldn't burn quota on every run.
+SEARCH_CACHE_FILE = os.path.join("cache", "pexels_searches.json")
+SEARCH_CACHE_TTL = 24 * 3600
+
+# Don't commit bandwidth to anything bigger than this without need
+MAX_DOWNLOAD_BYTES = 30_000_000
 
 class StockFetcher:
     """
     Fetches high-quality stock video from Pexels API.
     Smart selection: picks the BEST matching video based on quality score.
     """
-    
+
     def __init__(self, api_key: str = None):
         self.api_key = api_key or os.getenv("PEXELS_API_KEY")
         if not self.api_key:
             logging.warning("⚠️ PEXELS_API_KEY missing. Stock fetch will fail.")
-        
+
         self.headers = {"Authorization": self.api_key} if self.api_key else {}
         self.download_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets", "footage")
         os.makedirs(self.download_dir, exist_ok=True)
 
+        # One pooled session for all searches + downloads: the TLS handshake
+        # to Pexels is paid once, and transient 429/5xx responses retry with
+        # backoff instead of failing the scene.
+        self.session = requests.Session()
+        retry = Retry(total=3, backoff_factor=0.5,
+                      status_forcelist=(429, 500, 502, 503, 504),
+                      allowed_methods=("GET", "HEAD"))
+        adapter = HTTPAdapter(max_retries=retry, pool_maxsize=10)
+        self.session.mount("https://", adapter)
+        self.session.headers.update(self.headers)
+
+        self._search_cache = None  # lazy {key: {"ts":..., "data":...}}, persisted to disk
+
+    # --- Search-result cache (memory + 24h disk persistence) ---
+
+    def _load_search_cache(self) -> dict:
+        if self._search_cache is None:
+            try:
+                with open(SEARCH_CACHE_FILE, "r", encoding="utf-8") as f:
+                    self._search_cache = json.load(f)
+            except Exception:
+                self._search_cache = {}
+        return self._search_cache
+
+    def _save_search_cache(self):
+        try:
+            os.makedirs(os.path.dirname(SEARCH_CACHE_FILE), exist_ok=True)
+            with open(SEARCH_CACHE_FILE, "w", encoding="utf-8") as f:
+                json.dump(self._search_cache, f)
+        except Exception as e:
+            logging.warning(f"   ⚠️ Pexels search cache write failed: {e}")
+
+    def _cache_get(self, query: str, orientation: str):
+        entry = self._load_search_cache().get(f"{orientation}:{query.lower()}")
+        if entry and (time.time() - entry["ts"]) < SEARCH_CACHE_TTL:
+            logging.info(f"   💾 Cached Pexels search: '{query}'")
+            return entry["data"]
+        return None
+
+    def _cache_put(self, query: str, orientation: str, data: dict):
+        # Only cache useful payloads; empty results may be transient
+        if data.get("videos"):
+            self._load_search_cache()[f"{orientation}:{query.lower()}"] = {"ts": time.time(), "data": data}
+            self._save_search_cache()
+
+    def _cached_search(self, query: str, orientation: str, per_page: int) -> dict:
+        """Search via the pooled session, memoized per (query, orientation)."""
+        data = self._cache_get(query, orientation)
+        if data is None:
+            data = self.session.get(self._search_url(query, orientation, per_page), timeout=15).json()
+            self._cache_put(query, orientation, data)
+        return data
+
     def _score_video(self, video: dict, min_duration: int) -> float:
         """
         Score a video based on quality factors.
         Higher score = better video.
         """
         score = 0.0
-        
+
         # Duration score (prefer videos that fit our needs)
         duration = video.get("duration", 0)
         if duration >= min_duration:
@@ -36,7 +111,7 @@ class StockFetcher:
                 score += 20  # Not too long (easier to trim)
         else:
             score -= 50  # Too short
-        
+
         # Resolution score
         video_files = video.get("video_files", [])
         max_height = max((f.get("height", 0) for f in video_files), default=0)
@@ -44,14 +119,70 @@ class StockFetcher:
             score += 40  # Full HD
         elif max_height >= 720:
             score += 20  # HD
-        
+
         # Popularity indicators
         # Note: Pexels doesn't give views but files count can indicate quality
         if len(video_files) >= 4:
             score += 10  # Multiple quality options = professionally processed
-        
+
         return score
 
+    def _search_url(self, query: str, orientation: str, per_page: int) -> str:
+        return f"https://api.pexels.com/videos/search?query={query}&orientation={orientation}&per_page={per_page}"
+
+    def _select_best_file(self, data: dict, query: str, min_duration: int):
+        """
+        Scores the search results and picks the best downloadable file.
+        Returns (download_url, filepath, res_info, video_id) or None.
+        Shared by the sync and async search paths.
+        """
+        videos = data.get("videos") or []
+        if not videos:
+            return None
+
+        # Score all videos and pick the best one
+        scored_videos = sorted(((self._score_video(v, min_duration), v) for v in videos),
+                               key=lambda x: x[0], reverse=True)
+        best_score, video = scored_videos[0]
+        logging.info(f"   🎯 Best match: {video['id']} (score: {best_score})")
+
+        # Size-aware pick: sort ascending and take the SMALLEST file that
+        # still covers 1080p. Descending order grabbed the first 1080p+
+        # entry, which on high-res-heavy queries is often the 4K variant —
+        # tens of MB for pixels that get scaled away.
+        video_files = video.get("video_files", [])
+        video_files.sort(key=lambda x: x.get("height", 0))
+
+        selected_file = next((f for f in video_files
+                              if f.get("height", 0) >= 1080 and f.get("width", 0) <= 1920), None)
+
+        if not selected_file:
+            # Only oversized variants left: HEAD-probe them and take the
+            # first within budget before committing bandwidth.
+            for f in video_files:
+                if f.get("height", 0) < 1080:
+                    continue
+                try:
+                    resp = self.session.head(f["link"], timeout=10, allow_redirects=True)
+                    if int(resp.headers.get("Content-Length") or 0) < MAX_DOWNLOAD_BYTES:
+                        selected_file = f
+                        break
+                except Exception:
+                    continue
+
+        if not selected_file:
+            # Fall back to the smallest available file
+            selected_file = video_files[0] if video_files else None
+        if not selected_file:
+            logging.error("   ❌ No downloadable file found")
+            return None
+
+        # Filename with video ID to cache
+        safe_query = query.replace(" ", "_")[:20]
+        filepath = os.path.join(self.download_dir, f"{safe_query}_{video['id']}.mp4")
+        res_info = f"{selected_file.get('width', '?')}x{selected_file.get('height', '?')}"
+        return selected_file["link"], filepath, res_info, video["id"]
+
     def search_video(self, query: str, orientation: str = "portrait", min_duration: int = 5) -> str:
         """
         Search and download the BEST video matching the query.
@@ -61,87 +192,105 @@ class StockFetcher:
         if not self.api_key:
             logging.error("❌ No Pexels Key")
             return None
-            
+
         logging.info(f"🔍 Searching Pexels for: '{query}'")
-        
-        # Fetch more videos for better selection
-        url = f"https://api.pexels.com/videos/search?query={query}&orientation={orientation}&per_page=15"
-        
+
         try:
-            response = requests.get(url, headers=self.headers)
-            data = response.json()
-            
+            # Fetch more videos for better selection
+            data = self._cached_search(query, orientation, 15)
+
             if not data.get("videos"):
                 logging.warning(f"   ❌ No videos found for '{query}'")
                 # Try with simpler query
                 simple_query = query.split()[0] if " " in query else query
-                url = f"https://api.pexels.com/videos/search?query={simple_query}&orientation={orientation}&per_page=10"
-                response = requests.get(url, headers=self.headers)
-                data = response.json()
-                if not data.get("videos"):
-                    return None
-            
-            # Score all videos and pick the best one
-            videos = data["videos"]
-            scored_videos = []
-            
-            for video in videos:
-                score = self._score_video(video, min_duration)
-                scored_videos.append((score, video))
-            
-            # Sort by score descending
-            scored_videos.sort(key=lambda x: x[0], reverse=True)
-            
-            # Pick the best one
-            best_score, video = scored_videos[0]
-            logging.info(f"   🎯 Best match: {video['id']} (score: {best_score})")
-            
-            # Get best quality video file (prefer 1080p for balance of quality/size)
-            video_files = video["video_files"]
-            
-            # Sort by height descending
-            video_files.sort(key=lambda x: x.get("height", 0), reverse=True)
-            
-            # Prefer 1080p, fallback to highest available
-            selected_file = None
-            for f in video_files:
-                if f.get("height") == 1080:
-                    selected_file = f
-                    break
-            
-            if not selected_file:
-                # Get highest quality available
-                selected_file = video_files[0] if video_files else None
-            
-            if not selected_file:
-                logging.error("   ❌ No downloadable file found")
+                data = self._cached_search(simple_query, orientation, 10)
+
+            selected = self._select_best_file(data, query, min_duration)
+            if not selected:
                 return None
-            
-            download_url = selected_file["link"]
-            
-            # Filename with video ID to cache
-            safe_query = query.replace(" ", "_")[:20]
-            filename = f"{safe_query}_{video['id']}.mp4"
-            filepath = os.path.join(self.download_dir, filename)
-            
+            download_url, filepath, res_info, video_id = selected
+
             # Check if exists (cached)
             if os.path.exists(filepath):
-                logging.info(f"   ✅ Cached: {filename}")
+                logging.info(f"   ✅ Cached: {os.path.basename(filepath)}")
                 return filepath
-            
+
             # Download
-            res_info = f"{selected_file.get('width', '?')}x{selected_file.get('height', '?')}"
-            logging.info(f"   ⬇️ Downloading {video['id']} ({res_info})...")
-            
-            with requests.get(download_url, stream=True, timeout=60) as r:
+            logging.info(f"   ⬇️ Downloading {video_id} ({res_info})...")
+            with self.session.get(download_url, stream=True, timeout=60) as r:
                 r.raise_for_status()
                 with open(filepath, "wb") as f:
-                    for chunk in r.iter_content(chunk_size=8192):
+                    for chunk in r.iter_content(chunk_size=DOWNLOAD_CHUNK):
+                        f.write(chunk)
+
+            logging.info(f"   ✅ Saved: {os.path.basename(filepath)}")
+            return filepath
+
+        except Exception as e:
+            logging.error(f"❌ Pexels Error: {e}")
+            return None
+
+    async def asearch_video(self, query: str, orientation: str = "portrait",
+                            min_duration: int = 5, session=None) -> str:
+        """
+        Async variant of search_video: several scene downloads can overlap
+        with each other (and with TTS) inside one event loop instead of
+        streaming serially. Pass a shared aiohttp.ClientSession from the
+        orchestrator; one is created per call otherwise.
+        """
+        if not AIOHTTP_AVAILABLE:
+            # No aiohttp installed: run the sync path in a worker thread so
+            # callers still get overlap with the rest of the loop.
+            return await asyncio.get_running_loop().run_in_executor(
+                None, self.search_video, query, orientation, min_duration)
+
+        if not self.api_key:
+            logging.error("❌ No Pexels Key")
+            return None
+
+        logging.info(f"🔍 Searching Pexels for: '{query}'")
+        owns_session = session is None
+        if owns_session:
+            session = aiohttp.ClientSession(headers=self.headers)
+
+        try:
+            data = self._cache_get(query, orientation)
+            if data is None:
+                async with session.get(self._search_url(query, orientation, 15)) as resp:
+                    data = await resp.json()
+                self._cache_put(query, orientation, data)
+
+            if not data.get("videos"):
+                logging.warning(f"   ❌ No videos found for '{query}'")
+                simple_query = query.split()[0] if " " in query else query
+                data = self._cache_get(simple_query, orientation)
+                if data is None:
+                    async with session.get(self._search_url(simple_query, orientation, 10)) as resp:
+                        data = await resp.json()
+                    self._cache_put(simple_query, orientation, data)
+
+            selected = self._select_best_file(data, query, min_duration)
+            if not selected:
+                return None
+            download_url, filepath, res_info, video_id = selected
+
+            if os.path.exists(filepath):
+                logging.info(f"   ✅ Cached: {os.path.basename(filepath)}")
+                return filepath
+
+            logging.info(f"   ⬇️ Downloading {video_id} ({res_info})...")
+            async with session.get(download_url) as resp:
+                resp.raise_for_status()
+                with open(filepath, "wb") as f:
+                    async for chunk in resp.content.iter_chunked(DOWNLOAD_CHUNK):
                         f.write(chunk)
-            
-            logging.info(f"   ✅ Saved: {filename}")
+
+            logging.info(f"   ✅ Saved: {os.path.basename(filepath)}")
             return filepath
-            
+
         except Exception as e:
             logging.error(f"❌ Pexels Error: {e}")
             return None
+        finally:
+            if owns_session:
+                await session.close()
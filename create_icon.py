@@ -1,19 +1,63 @@
-from PIL import Image, ImageDraw, ImageFont, ImageFilter
+from PIL import Image, ImageDraw, ImageFont
 import os
 
-os.makedirs("assets/zodiac_icons", exist_ok=True)
-img = Image.new('RGBA', (200, 200), (0, 0, 0, 0))
-draw = ImageDraw.Draw(img)
-# Draw a golden circle
-draw.ellipse([10, 10, 190, 190], outline="gold", width=5)
-# Draw text "♈"
-try:
-    font = ImageFont.truetype("arial", 100)
-except:
-    font = ImageFont.load_default()
-    
-# Draw 'A' as fallback symbol
-draw.text((70, 40), "A", fill="gold", font=font)
-
-img.save("assets/zodiac_icons/Mesh (Aries).png")
-print("Placeholder icon created.")
+ICON_DIR = os.path.join("assets", "zodiac_icons")
+
+# (filename stem, zodiac glyph) — names match RASHI_IMAGE_MAP keys
+ZODIAC = [
+    ("Mesh (Aries)", "♈"),
+    ("Vrushabh (Taurus)", "♉"),
+    ("Mithun (Gemini)", "♊"),
+    ("Kark (Cancer)", "♋"),
+    ("Singh (Leo)", "♌"),
+    ("Kanya (Virgo)", "♍"),
+    ("Tula (Libra)", "♎"),
+    ("Vrushchik (Scorpio)", "♏"),
+    ("Dhanu (Sagittarius)", "♐"),
+    ("Makar (Capricorn)", "♑"),
+    ("Kumbh (Aquarius)", "♒"),
+    ("Meen (Pisces)", "♓"),
+]
+
+
+def create_icons(force: bool = False):
+    """
+    Generates the 12 placeholder zodiac icons.
+
+    Cheap to call as a preflight: icons that already exist are skipped,
+    one font handle and one gold-circle template are shared across all
+    twelve (each icon starts as a template.copy(), only the glyph differs).
+    """
+    os.makedirs(ICON_DIR, exist_ok=True)
+    pending = [(name, glyph) for name, glyph in ZODIAC
+               if force or not os.path.exists(os.path.join(ICON_DIR, f"{name}.png"))]
+    if not pending:
+        print("Icons already exist, nothing to do.")
+        return
+
+    try:
+        font = ImageFont.truetype("arial", 100)
+    except:
+        font = ImageFont.load_default()
+
+    # Draw the golden circle once; copies are a memcpy
+    template = Image.new('RGBA', (200, 200), (0, 0, 0, 0))
+    ImageDraw.Draw(template).ellipse([10, 10, 190, 190], outline="gold", width=5)
+
+    for name, glyph in pending:
+        img = template.copy()
+        draw = ImageDraw.Draw(img)
+        try:
+            bbox = draw.textbbox((0, 0), glyph, font=font)
+            x = (200 - (bbox[2] - bbox[0])) // 2 - bbox[0]
+            y = (200 - (bbox[3] - bbox[1])) // 2 - bbox[1]
+            draw.text((x, y), glyph, fill="gold", font=font)
+        except Exception:
+            # Font without zodiac glyphs: first letter as fallback symbol
+            draw.text((70, 40), name[0], fill="gold", font=font)
+        img.save(os.path.join(ICON_DIR, f"{name}.png"))
+        print(f"Icon created: {name}")
+
+
+if __name__ == "__main__":
+    create_icons()
@@ -1,17 +1,24 @@
 import os
+import time
+import shutil
+import hashlib
 import logging
 import json
 import asyncio
 import nest_asyncio
+from functools import lru_cache
 from playwright.async_api import async_playwright
-from moviepy.editor import ImageSequenceClip, AudioFileClip, CompositeAudioClip, vfx, CompositeVideoClip
+from moviepy.editor import ImageSequenceClip, ImageClip, AudioFileClip, CompositeAudioClip, vfx, CompositeVideoClip, VideoClip
+from bisect import bisect_right
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont, ImageFilter
 
 # Allow nested asyncio loops (required for Playwright in some envs)
 nest_asyncio.apply()
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+# Same guard as agents/__init__.py: configure only if nobody has yet
+if not logging.getLogger().handlers:
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
 # Rashi name to filename mapping
 RASHI_IMAGE_MAP = {
@@ -80,24 +87,209 @@ COLOR_STYLES = {
     "silver": {"grad": ("#101520", "#546e7a", "#cfd8dc"), "glow": "#b0bec5", "element": "water"},
 }
 
+# Font locations for the PIL fallback renderer (Devanagari-capable first)
+FONT_CANDIDATES = (
+    os.path.join("assets", "fonts", "NotoSansDevanagari-Bold.ttf"),
+    "C:/Windows/Fonts/Nirmala.ttf",
+    "/usr/share/fonts/truetype/noto/NotoSansDevanagari-Regular.ttf",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+)
+
+
+def _find_font_path():
+    for candidate in FONT_CANDIDATES:
+        if os.path.exists(candidate):
+            return candidate
+    return None
+
+
+@lru_cache(maxsize=256)
+def _wrap_text(text: str, font_path: str, font_size: int, max_width: int) -> tuple:
+    """Greedy word wrap. Cached: the same scene text gets re-measured on
+    every retry and rerun, and wrapping is pure in its arguments.
+
+    Widths come from font.getlength per word (cached glyph metrics) and a
+    running scalar, instead of re-shaping the whole accumulated line with
+    textbbox on every append — O(N) shaping calls instead of O(N²).
+    """
+    font = ImageFont.truetype(font_path, font_size) if font_path else ImageFont.load_default()
+    space_w = font.getlength(" ")
+    lines, current = [], []
+    running_width = 0.0
+    for word in text.split():
+        word_w = font.getlength(word)
+        joined_w = running_width + (space_w if current else 0) + word_w
+        if joined_w > max_width and current:
+            lines.append(" ".join(current))
+            current = [word]
+            running_width = word_w
+        else:
+            current.append(word)
+            running_width = joined_w
+    if current:
+        lines.append(" ".join(current))
+    return tuple(lines)
+
+
+# Hardware H.264 encoders in preference order. A GPU/ASIC encoder frees the
+# CPU for frame generation and typically encodes several times faster than
+# libx264 at comparable bitrate; libx264 is the universal fallback.
+# h264_videotoolbox is excluded (like h264_vaapi): FFMPEG_VideoWriter always
+# passes -preset, an option that encoder doesn't define, so every encode
+# through it would fail.
+HW_ENCODERS = ("h264_nvenc", "h264_qsv")
+_detected_encoder = None
+
+
+def _encoder_works(encoder: str) -> bool:
+    """
+    One-frame null encode to prove the encoder actually runs here.
+    `ffmpeg -encoders` only lists what ffmpeg was compiled with — stock
+    builds advertise nvenc/qsv on machines with no GPU at all (CI runners
+    included), where the encoder fails the moment it opens.
+    """
+    try:
+        import subprocess
+        probe = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-v", "error", "-f", "lavfi",
+             "-i", "color=black:s=64x64", "-frames:v", "1",
+             "-c:v", encoder, "-f", "null", "-"],
+            capture_output=True, timeout=20)
+        return probe.returncode == 0
+    except Exception:
+        return False
+
+
+def detect_encoder() -> str:
+    """Picks the best working H.264 encoder, probing ffmpeg once per process."""
+    global _detected_encoder
+    if _detected_encoder is None:
+        try:
+            import subprocess
+            probe = subprocess.run(["ffmpeg", "-hide_banner", "-encoders"],
+                                   capture_output=True, text=True, timeout=10)
+            available = probe.stdout
+        except Exception as e:
+            logging.warning(f"⚠️ ffmpeg encoder probe failed: {e}")
+            available = ""
+        _detected_encoder = next(
+            (enc for enc in HW_ENCODERS if enc in available and _encoder_works(enc)),
+            "libx264")
+        logging.info(f"🎥 Video encoder: {_detected_encoder}")
+    return _detected_encoder
+
+
+# A full video's Playwright frame cache is a few GB of PNGs; tmpfs is only
+# a win when it can hold that comfortably, and cached entries must age out
+# or /dev/shm eventually fills and every screenshot starts failing.
+SHM_TEMP_DIR = "/dev/shm/yt_jyotish_temp"
+SHM_MIN_FREE_BYTES = 6 * 1024 ** 3
+TEMP_EVICT_AGE = 3 * 24 * 3600  # daily content; frames go stale fast
+
+
+def _pick_temp_dir() -> str:
+    """tmpfs when present and roomy enough for a video's frames; disk otherwise."""
+    if os.path.isdir("/dev/shm"):
+        try:
+            st = os.statvfs("/dev/shm")
+            if st.f_bavail * st.f_frsize >= SHM_MIN_FREE_BYTES:
+                return SHM_TEMP_DIR
+            logging.info("ℹ️ /dev/shm low on space; keeping temp assets on disk")
+        except OSError:
+            pass
+    return os.path.join("assets", "temp")
+
+
+def _evict_stale_temp(temp_dir: str):
+    """
+    Drops frames_*/text_* cache entries older than TEMP_EVICT_AGE. The
+    caches are deliberately kept between runs for reuse, but nothing else
+    deletes them — repeated runs (or a monthly-drip day rendering several
+    videos) would otherwise accumulate gigabytes until the volume fills.
+    """
+    cutoff = time.time() - TEMP_EVICT_AGE
+    try:
+        names = os.listdir(temp_dir)
+    except OSError:
+        return
+    for name in names:
+        if not name.startswith(("frames_", "text_")):
+            continue
+        path = os.path.join(temp_dir, name)
+        try:
+            if os.path.getmtime(path) < cutoff:
+                shutil.rmtree(path) if os.path.isdir(path) else os.remove(path)
+        except OSError:
+            continue
+
+
 class EditorEngine:
     """
     Premium HYBRID Video Engine.
     Uses Playwright (Headless Chrome) to render HTML5 animations to valid video frames.
     Compiles with MoviePy.
     """
-    
-    def __init__(self):
+
+    def __init__(self, encoder: str = "auto"):
         self.width = 1080
         self.height = 1920
         self.template_path = os.path.abspath("templates/scene.html")
-        os.makedirs("assets/temp", exist_ok=True)
+        self.encoder = detect_encoder() if encoder == "auto" else encoder
+        # Fallback-renderer font: resolve the path once and cache loaded
+        # sizes on the instance — Devanagari TTFs carry megabytes of
+        # OpenType tables, so re-parsing per scene is pure overhead.
+        self.font_path = _find_font_path()
+        self._font_cache = {}
+        self._bg_template = None  # shared text-image backdrop, built on first use
+        self._text_image_cache = {}  # (text, font_size) -> rendered RGBA array
+        self._photo_cache = {}  # image path -> pre-resized rashi photo
+        self._photo_shadow_img = None  # analytic drop shadow, built on first use
+        self._gradient_cache = {}  # grad color tuple -> rendered background
+        self._word_cache = {}  # (word, font_size) -> karaoke RGBA array
+        # Frame captures and overlay PNGs churn through this dir; on Linux
+        # /dev/shm (tmpfs) keeps that round-trip in RAM instead of hitting
+        # disk, provided it has room for a video's worth of frames.
+        # Cross-run cache hits (frames_<digest>, text_<digest>.png) work
+        # either way; stale entries are evicted up front so the cache can
+        # never fill the volume.
+        self.temp_dir = _pick_temp_dir()
+        os.makedirs(self.temp_dir, exist_ok=True)
+        _evict_stale_temp(self.temp_dir)
 
     def _get_rashi_key(self, rashi_name: str) -> str:
         """Extract rashi key from name like 'Mesh (Aries)'."""
         rashi_key = rashi_name.lower().split()[0].split("(")[0].strip()
         return rashi_key
 
+    def _get_style(self, rashi_key: str, theme_override: str = None) -> dict:
+        """Style resolution: COLOR_THEME > RASHI_STYLES > neutral fallback."""
+        if theme_override and theme_override in COLOR_STYLES:
+            return COLOR_STYLES[theme_override]
+        return RASHI_STYLES.get(rashi_key) or {
+            "grad": ("#303060", "#202040", "#101020"), "glow": "#ffffff", "element": "neutral"}
+
+    def _text_bg_template(self) -> Image.Image:
+        """
+        Shared 1080x600 RGBA backdrop for every text overlay: a translucent
+        rounded panel, drawn once. Each text image starts as a copy() of
+        this (a plain memcpy) instead of a fresh allocate-and-fill plus the
+        same primitive draws repeated per section.
+        """
+        if self._bg_template is None:
+            tpl = Image.new("RGBA", (self.width, 600), (0, 0, 0, 0))
+            draw = ImageDraw.Draw(tpl)
+            draw.rounded_rectangle((40, 40, self.width - 40, 560), radius=40, fill=(0, 0, 0, 140))
+            self._bg_template = tpl
+        return self._bg_template
+
+    def _get_font(self, size: int):
+        """Returns the fallback font at `size`, loading each size at most once."""
+        font = self._font_cache.get(size)
+        if font is None:
+            font = ImageFont.truetype(self.font_path, size) if self.font_path else ImageFont.load_default()
+            self._font_cache[size] = font
+        return font
+
     def get_rashi_image_path(self, rashi_name: str) -> str:
         """Finds the appropriate rashi image from the 12_photos folder."""
         rashi_key = self._get_rashi_key(rashi_name)
@@ -117,27 +309,32 @@ class EditorEngine:
         Renders the scene using Playwright.
         Captures screenshots at 30 FPS.
         """
-        frames_dir = f"assets/temp/frames_{hash(text)}"
+        fps = 30
+        total_frames = int(duration * fps)
+
+        # Content-addressed frames dir: everything that shapes the pixels
+        # goes into the digest. The old hash(text) was salted per process
+        # (PYTHONHASHSEED), which silently orphaned every previous run's
+        # frames and re-captured identical scenes from scratch.
+        scene_key = json.dumps(
+            [rashi_name, text, theme_override or "", total_frames, subtitle_data],
+            ensure_ascii=False, sort_keys=True)
+        digest = hashlib.blake2b(scene_key.encode("utf-8"), digest_size=8).hexdigest()
+        frames_dir = os.path.join(self.temp_dir, f"frames_{digest}")
+
+        frames = [os.path.join(frames_dir, f"frame_{i:04d}.png") for i in range(total_frames)]
+        if frames and all(map(os.path.exists, frames)):
+            logging.info(f"   💾 Reusing {total_frames} cached frames for scene")
+            return frames
         os.makedirs(frames_dir, exist_ok=True)
-        
+
         # Prepare params
         # rashi_name comes in as "Mesh" (cleaned) or "Mesh (Aries)"
         # We need to find the image for it.
         rashi_img = self.get_rashi_image_path(rashi_name) or ""
         rashi_key = self._get_rashi_key(rashi_name)
-        
-        # Get style: COLOR_THEME > RASHI_STYLES > Fallback
-        style = None
-        if theme_override and theme_override in COLOR_STYLES:
-            style = COLOR_STYLES[theme_override]
-        
-        if not style:
-             style = RASHI_STYLES.get(rashi_key)
-             
-        if not style:
-             # Fallback
-             style = {"grad": ("#303060", "#202040", "#101020"), "glow": "#ffffff", "element": "neutral"}
-        
+        style = self._get_style(rashi_key, theme_override)
+
         grad = style["grad"] # (c1, c2, c3)
         glow = style["glow"]
         element = style["element"]
@@ -158,11 +355,7 @@ class EditorEngine:
                f"&glow={glow.replace('#', '%23')}&elem={element}")
         
         logging.info(f"   🌍 Launching Playwright for scene ({duration}s)...")
-        
-        frames = []
-        fps = 30
-        total_frames = int(duration * fps)
-        
+
         async with async_playwright() as p:
             browser = await p.chromium.launch(headless=True)
             page = await browser.new_page(viewport={"width": 1080, "height": 1920})
@@ -192,30 +385,236 @@ class EditorEngine:
                 await page.evaluate(f"window.seek({current_time})")
                 
                 # 3. Capture Frame
-                frame_path = os.path.join(frames_dir, f"frame_{i:04d}.png")
-                await page.screenshot(path=frame_path, type='png')
-                frames.append(frame_path)
+                await page.screenshot(path=frames[i], type='png')
             
             await browser.close()
             
         return frames
 
+    def _generate_text_image(self, text: str, font_size: int = 64) -> np.ndarray:
+        """
+        Renders wrapped caption text for the PIL fallback scene and returns
+        it as a 1080x600 RGBA numpy array — consumers composite it directly
+        with no PNG round-trip through assets/temp on the hot path. A
+        content-addressed PNG (stable blake2b digest; hash() is salted per
+        process) still backs the render across process boundaries, so
+        reruns skip rasterization entirely.
+        """
+        # Hottest tier first: same-process repeats skip even the stat()
+        cache_key = (text, font_size)
+        cached = self._text_image_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        digest = hashlib.blake2b(f"{font_size}|{text}".encode("utf-8"), digest_size=8).hexdigest()
+        temp_path = os.path.join(self.temp_dir, f"text_{digest}.png")
+        if os.path.exists(temp_path):
+            arr = np.array(Image.open(temp_path).convert("RGBA"))
+            self._text_image_cache[cache_key] = arr
+            return arr
+
+        img_w, img_h = self.width, 600
+        font = self._get_font(font_size)
+
+        img = self._text_bg_template().copy()
+        lines = _wrap_text(text, self.font_path or "", font_size, img_w - 150)
+
+        line_height = font_size + 18
+        y = max((img_h - line_height * len(lines)) // 2, 0)
+        for line in lines:
+            # Rasterize each line ONCE into a 1-byte/pixel L mask, then
+            # stamp shadow and fill as colored pastes of that mask — half
+            # the glyph rendering and a quarter of the buffer bandwidth of
+            # drawing twice into RGBA.
+            mask = Image.new("L", (int(font.getlength(line)) + 8, line_height + 10), 0)
+            ImageDraw.Draw(mask).text((0, 0), line, font=font, fill=255)
+            x = (img_w - mask.width) // 2
+            # Soft shadow under white fill keeps text readable on any gradient
+            img.paste((0, 0, 0, 180), (x + 3, y + 3), mask)
+            img.paste((255, 255, 255, 255), (x, y), mask)
+            y += line_height
+
+        try:
+            img.save(temp_path)  # cross-run cache; losing it never fails the render
+        except Exception as e:
+            logging.warning(f"   ⚠️ Text image cache write failed: {e}")
+        arr = np.array(img)
+        self._text_image_cache[cache_key] = arr
+        return arr
+
+    def _create_scene_fallback(self, rashi_name: str, text: str, duration: float,
+                               subtitle_data: list = None, theme_override: str = None):
+        """
+        Static PIL scene used when the Playwright render fails: themed
+        gradient + rashi photo + caption, plus karaoke word overlays when
+        subtitle timings are available. Less animated than the HTML
+        renderer, but the video still ships instead of dropping the section.
+        """
+        logging.info("   🖼️ Building fallback scene with PIL...")
+        rashi_key = self._get_rashi_key(rashi_name)
+        style = self._get_style(rashi_key, theme_override)
+
+        frame = self._create_gradient_image(style["grad"])
+
+        rashi_img_path = self.get_rashi_image_path(rashi_name)
+        if rashi_img_path:
+            shadow = self._photo_shadow()
+            frame.paste(shadow, ((self.width - shadow.width) // 2, 300 - 20 + 12), shadow)
+            frame.paste(self._get_rashi_photo(rashi_img_path), ((self.width - 600) // 2, 300))
+
+        text_img = Image.fromarray(self._generate_text_image(text))
+        frame.paste(text_img, (0, 1050), text_img)
+
+        base_arr = np.array(frame)
+        if subtitle_data:
+            karaoke = self._karaoke_clip(base_arr, subtitle_data, duration)
+            if karaoke is not None:
+                return karaoke
+        return ImageClip(base_arr).set_duration(duration)
+
+    def _create_gradient_image(self, colors: tuple) -> Image.Image:
+        """
+        Vertical 3-stop gradient (top, middle, bottom) at full frame size.
+        Built as two numpy linspace ramps broadcast across the width — one
+        vectorized pass instead of 1920 Python-level draw.line iterations
+        with per-row float math.
+        """
+        cached = self._gradient_cache.get(colors)
+        if cached is None:
+            top, mid, bottom = (np.array([int(c[i:i + 2], 16) for i in (1, 3, 5)], dtype=np.float32)
+                                for c in colors)
+            half = self.height // 2
+            ramp = np.vstack([
+                np.linspace(top, mid, half, endpoint=False),
+                np.linspace(mid, bottom, self.height - half),
+            ])
+            arr = np.broadcast_to(ramp[:, None, :], (self.height, self.width, 3)).astype(np.uint8)
+            cached = Image.fromarray(arr, "RGB")
+            self._gradient_cache[colors] = cached
+        # Callers composite onto the frame, so hand out a copy of the master
+        return cached.copy()
+
+    def _render_karaoke_word(self, word: str, font_size: int = 72) -> np.ndarray:
+        """
+        Renders one highlighted karaoke word as an RGBA array (no disk).
+        Cached per (word, size): narration repeats short words constantly,
+        so rasterization cost is O(unique words), not O(total words).
+        """
+        cache_key = (word, font_size)
+        cached = self._word_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        font = self._get_font(font_size)
+        pad = 20
+        w = int(font.getlength(word)) + pad * 2
+        h = font_size + pad * 2
+        img = Image.new("RGBA", (w, h), (0, 0, 0, 0))
+        # Warm glow: rasterize the word ONCE into an L mask and blur it,
+        # instead of five offset draw.text passes that each re-shape and
+        # re-render the full glyph run.
+        glow = Image.new("L", (w, h), 0)
+        ImageDraw.Draw(glow).text((pad, pad), word, font=font, fill=255)
+        img.paste((255, 140, 0, 200), mask=glow.filter(ImageFilter.GaussianBlur(4)))
+        ImageDraw.Draw(img).text((pad, pad), word, font=font, fill=(255, 215, 0, 255))
+        arr = np.array(img)
+        self._word_cache[cache_key] = arr
+        return arr
+
+    def _karaoke_clip(self, base_arr: np.ndarray, subtitle_data: list, duration: float):
+        """
+        The karaoke track for one fallback scene as a single frame-function
+        clip. The previous shape — one ImageClip per word stacked in a
+        CompositeVideoClip — made MoviePy test every layer's time window
+        on every frame; here the active word is found by bisecting the
+        sorted start times and alpha-blended onto the precomposed base
+        frame, so per-frame cost is O(log N) plus one word-sized blend
+        regardless of word count. Returns None when no word is usable.
+        """
+        entries = []  # (start, end, word RGBA array, x, y)
+        for sub in sorted(subtitle_data, key=lambda s: s.get("start", 0)):
+            word = str(sub.get("text", "")).strip()
+            start = sub.get("start", 0)
+            if not word or start >= duration:
+                continue
+            arr = self._render_karaoke_word(word)
+            x = max((self.width - arr.shape[1]) // 2, 0)
+            entries.append((start, min(start + sub.get("duration", 0.5), duration),
+                            arr, x, self.height - 280))
+        if not entries:
+            return None
+        starts = [e[0] for e in entries]
+
+        def make_frame(t):
+            i = bisect_right(starts, t) - 1
+            if i < 0 or t >= entries[i][1]:
+                return base_arr
+            _, _, word, x, y = entries[i]
+            frame = base_arr.copy()
+            region = frame[y:y + word.shape[0], x:x + word.shape[1]]
+            word = word[:region.shape[0], :region.shape[1]]
+            alpha = word[:, :, 3:].astype(np.float32) / 255.0
+            region[:] = (word[:, :, :3] * alpha + region * (1.0 - alpha)).astype(np.uint8)
+            return frame
+
+        return VideoClip(make_frame, duration=duration)
+
+    def _photo_shadow(self) -> Image.Image:
+        """
+        Soft drop shadow behind the rashi photo, grounding it on the
+        gradient. The alpha plane is the outer product of two 1D edge
+        ramps — an analytic soft-edged rectangle in O(W+H) math, where
+        drawing a rectangle and Gaussian-blurring it would run a full 2D
+        convolution over every pixel. Built once per process.
+        """
+        if self._photo_shadow_img is None:
+            margin = 20
+            size = 600 + 2 * margin
+            edge = np.clip(np.minimum(np.arange(size), size - 1 - np.arange(size)) / margin, 0, 1)
+            rgba = np.zeros((size, size, 4), dtype=np.uint8)
+            rgba[..., 3] = (100 * np.outer(edge, edge)).astype(np.uint8)
+            self._photo_shadow_img = Image.fromarray(rgba, "RGBA")
+        return self._photo_shadow_img
+
+    def _get_rashi_photo(self, path: str) -> Image.Image:
+        """
+        Rashi photo pre-resized to the fallback overlay size, decoded and
+        resized at most once per process — the 12 source images are a fixed
+        set, so repeating the JPEG decode + resize per scene is pure waste.
+        Filled lazily rather than eagerly at __init__, since the fallback
+        renderer may never run.
+        """
+        photo = self._photo_cache.get(path)
+        if photo is None:
+            src = Image.open(path).convert("RGB")
+            # Downscales take BILINEAR: visually identical at this size
+            # and a fraction of the LANCZOS cost. The rare smaller-than-
+            # target source keeps LANCZOS, where upsampling quality
+            # actually shows.
+            resample = Image.BILINEAR if src.width >= 600 else Image.LANCZOS
+            photo = src.resize((600, 600), resample=resample, reducing_gap=3.0)
+            self._photo_cache[path] = photo
+        return photo
+
     def create_scene(self, rashi_name: str, text: str, duration: float, subtitle_data: list = None, theme_override: str = None):
         """Wrapper to run async render synchronously."""
         try:
             frames = asyncio.run(self._render_html_scene(rashi_name, text, duration, subtitle_data, theme_override))
-            
+
             if not frames:
                 raise Exception("No frames captured")
-                
+
             # Create video clip from frames
             clip = ImageSequenceClip(frames, fps=30)
             return clip
-            
+
         except Exception as e:
             logging.error(f"❌ Playwright Render Error: {e}")
             # Fallback to simple image if playwright fails
-            return None # Main loop will handle or crash
+            try:
+                return self._create_scene_fallback(rashi_name, text, duration, subtitle_data, theme_override)
+            except Exception as fallback_error:
+                logging.error(f"❌ Fallback render failed too: {fallback_error}")
+                return None # Main loop will handle or crash
 
     def assemble_final(self, scenes: list, output_path: str, mood: str = "peaceful"):
         """Assembles all scenes and adds background music."""
@@ -269,17 +668,99 @@ class EditorEngine:
         #         logging.error(f"   ⚠️ Music error: {e}")
         
         # Write final video
-        logging.info(f"   📹 Rendering to {output_path}...")
-        final_video.write_videofile(
-            output_path, 
-            fps=30, 
-            codec="libx264", 
-            audio_codec="aac",
-            threads=4,
-            preset="medium"
-        )
+        logging.info(f"   📹 Rendering to {output_path} ({self.encoder})...")
+        try:
+            self._stream_write(final_video, output_path)
+        except Exception as e:
+            if self.encoder == "libx264":
+                raise
+            # Last line of defense: a hardware encoder that passed the
+            # probe can still fail at full resolution (driver/session
+            # limits). The daily video matters more than the speedup.
+            logging.error(f"❌ {self.encoder} encode failed ({e}); retrying with libx264")
+            self.encoder = "libx264"
+            self._stream_write(final_video, output_path)
         logging.info(f"   ✅ Video saved: {output_path}")
 
+    def _stream_write(self, final_video, output_path: str, fps: int = 30):
+        """
+        Streams the final render into FFMPEG_VideoWriter through a small
+        bounded queue: a reader thread decodes frames (PNG decode is the
+        producer cost here) while the main thread feeds the encoder, so
+        decode and encode overlap instead of alternating as they do inside
+        write_videofile — and memory stays flat at ~32 frames regardless
+        of video length.
+        """
+        import queue
+        import threading
+        from moviepy.video.io.ffmpeg_writer import FFMPEG_VideoWriter
+
+        audiofile = None
+        if final_video.audio is not None:
+            audiofile = output_path + ".temp_audio.m4a"
+            final_video.audio.write_audiofile(audiofile, fps=44100, codec="aac",
+                                              verbose=False, logger=None)
+
+        preset = "medium"
+        ffmpeg_params = None
+        if self.encoder == "h264_nvenc":
+            # nvenc presets are p1..p7; vbr + cq gives x264-crf-like quality
+            preset = "p4"
+            ffmpeg_params = ["-rc", "vbr", "-cq", "23"]
+        elif self.encoder == "libx264":
+            # veryfast + crf 23 is visually indistinguishable from medium
+            # for 60s of 1080x1920 and cuts the encode wall time hard
+            preset = "veryfast"
+            ffmpeg_params = ["-crf", "23"]
+
+        frames = queue.Queue(maxsize=32)
+        _SENTINEL = object()
+        producer_error = []
+        stop = threading.Event()  # set when the consumer bails out early
+
+        def _produce():
+            try:
+                for frame in final_video.iter_frames(fps=fps, dtype="uint8"):
+                    if stop.is_set():
+                        return
+                    frames.put(frame)
+            except Exception as e:
+                producer_error.append(e)
+            finally:
+                frames.put(_SENTINEL)
+
+        reader = threading.Thread(target=_produce, daemon=True)
+        reader.start()
+
+        writer = FFMPEG_VideoWriter(output_path, (self.width, self.height), fps,
+                                    codec=self.encoder, preset=preset,
+                                    audiofile=audiofile, threads=4,
+                                    ffmpeg_params=ffmpeg_params)
+        try:
+            while True:
+                frame = frames.get()
+                if frame is _SENTINEL:
+                    break
+                writer.write_frame(frame)
+        finally:
+            # If write_frame raised mid-stream, the producer may be blocked
+            # in put() on the full queue and would never reach the sentinel
+            # — join() would then hang forever. Signal it to stop and drain
+            # whatever it has queued so the blocked put can complete.
+            stop.set()
+            try:
+                while True:
+                    frames.get_nowait()
+            except queue.Empty:
+                pass
+            writer.close()
+            reader.join()
+            if audiofile and os.path.exists(audiofile):
+                os.remove(audiofile)
+
+        if producer_error:
+            raise producer_error[0]
+
     def _select_music_by_mood(self, mood: str) -> str:
         """Selects background music based on mood."""
         import random
@@ -326,4 +807,8 @@ class EditorEngine:
 # Helper for concatenate to avoid circular dependencies if any
 def run_concatenate(clips):
     from moviepy.editor import concatenate_videoclips
-    return concatenate_videoclips(clips, method="compose")
+    # Every scene is exactly 1080x1920 (Playwright viewport / PIL fallback),
+    # so "chain" can splice frames directly. "compose" wrapped each clip in
+    # a CompositeVideoClip and re-rendered every frame through the
+    # alpha-compositing pipeline for no visual difference.
+    return concatenate_videoclips(clips, method="chain")
@@ -83,8 +83,10 @@ def produce_video_from_script(agents, rashi, title_suffix, script, date_str, the
     rashi_key = rashi.lower().split('(')[0].strip()
     rashi_hindi = RASHI_HINDI_MAP.get(rashi_key, rashi_key)
     
+    # Pass 1: prepare the text for every section (cheap, CPU-only)
+    speech_jobs = []  # (section, speech_text, display_text, audio_path, subtitle_path)
     for section in active_sections:
-        print(f"      🎤 Generating: {section.upper()}...")
+        print(f"      📝 Preparing: {section.upper()}...")
         original_text = str(script[section])
         
         # --- LOCALIZATION & CLEANUP ---
@@ -162,10 +164,18 @@ def produce_video_from_script(agents, rashi, title_suffix, script, date_str, the
              
         audio_path = f"assets/temp/{title_suffix}/{section}.mp3"
         subtitle_path = audio_path.replace(".mp3", ".json")
-        
-        # Only generate if not exists (or always overwrite to be safe? let's overwrite for fresh speed settings)
-        narrator.speak(speech_text, audio_path)
-        
+        speech_jobs.append((section, speech_text, display_text, audio_path, subtitle_path))
+
+    # Pass 2: narrate every section concurrently. Edge-TTS is pure network
+    # I/O, so the batch takes ~one section's latency instead of N.
+    print(f"      🎤 Narrating {len(speech_jobs)} sections in parallel...")
+    narrator.generate_audio_batch([
+        (speech_text, audio_path)
+        for _, speech_text, _, audio_path, _ in speech_jobs
+    ])
+
+    # Pass 3: measure durations and collect results
+    for section, speech_text, display_text, audio_path, subtitle_path in speech_jobs:
         if os.path.exists(audio_path):
             try:
                 clip = AudioFileClip(audio_path)